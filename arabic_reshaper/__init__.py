@@ -1,7 +1,21 @@
 import os
 
-from .arabic_reshaper import reshape, default_reshaper, ArabicReshaper
+from .arabic_reshaper import (reshape, reshape_to, reshape_bytes,
+                             reshape_into, reshape_variants,
+                             reshape_parallel, iter_reshape,
+                             reshape_runs, compile_template, unreshape,
+                             default_reshaper, ArabicReshaper)
+from .batch import reshape_batch
+from .catalogs import reshape_catalog
+from .columns import reshape_series, reshape_arrow
+from .lexicon import build_lexicon
+from .records import reshape_csv, reshape_jsonl
+from .shared_cache import SharedResultCache
+from .sqlite import register_sqlite_functions
+from .subtitles import reshape_subtitles, reshape_subtitle_files
 from .reshaper_config import (config_for_true_type_font,
+                              configs_for_fonts,
+                              glyphs_for_true_type_font,
                               ENABLE_NO_LIGATURES,
                               ENABLE_SENTENCES_LIGATURES,
                               ENABLE_WORDS_LIGATURES,
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# The command line interface:
+#
+#   $ python -m arabic_reshaper csv --columns name,city in.csv -o out.csv
+#   $ python -m arabic_reshaper jsonl --paths user.name in.jsonl > out.jsonl
+#   $ python -m arabic_reshaper subtitles *.srt -o shaped/
+#   $ python -m arabic_reshaper catalog ar/messages.po -o ar/messages.mo
+
+import argparse
+import contextlib
+import os
+import sys
+
+from .arabic_reshaper import ArabicReshaper
+from .catalogs import reshape_catalog
+from .records import reshape_csv, reshape_jsonl
+from .subtitles import reshape_subtitles, reshape_subtitle_files
+
+
+def _column(column):
+    return int(column) if column.isdigit() else column
+
+
+def _csv(args, reshaper):
+    with _open_files(args.input, args.output) as (input, output):
+        reshape_csv(input, output, [_column(column)
+                                    for column in args.columns.split(',')],
+                    reshaper, header=args.header, encoding=args.encoding,
+                    workers=args.workers, batch_size=args.batch_size,
+                    delimiter=args.delimiter)
+
+
+def _jsonl(args, reshaper):
+    with _open_files(args.input, args.output) as (input, output):
+        reshape_jsonl(input, output, args.paths.split(','), reshaper,
+                      workers=args.workers, batch_size=args.batch_size)
+
+
+def _catalog(args, reshaper):
+    with _open_files(args.input, args.output) as (input, output):
+        reshape_catalog(input, output, reshaper)
+
+
+def _subtitles(args, reshaper):
+    if len(args.inputs) < 2 and not (args.output and
+                                     os.path.isdir(args.output)):
+        input_path = args.inputs[0] if args.inputs else None
+        with _open_files(input_path, args.output) as (input, output):
+            reshape_subtitles(input, output, reshaper,
+                              encoding=args.encoding)
+        return
+    if not args.output:
+        raise SystemExit('an output directory is needed for several files')
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+    reshape_subtitle_files(
+        [(path, os.path.join(args.output, os.path.basename(path)))
+         for path in args.inputs],
+        reshaper, encoding=args.encoding, workers=args.workers
+    )
+
+
+@contextlib.contextmanager
+def _open_files(input_path, output_path):
+    # The input and output files, or the standard input and output
+    input = (open(input_path, 'rb') if input_path
+             else sys.stdin.buffer)
+    output = (open(output_path, 'wb') if output_path
+              else sys.stdout.buffer)
+    try:
+        yield input, output
+    finally:
+        if input_path:
+            input.close()
+        if output_path:
+            output.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m arabic_reshaper',
+        description='Reshape the Arabic text of files.'
+    )
+    parser.add_argument('--configuration-file',
+                        help='configuration of the reshaper')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    def add_command(name, function, help):
+        command = commands.add_parser(name, help=help)
+        command.set_defaults(function=function)
+        command.add_argument('input', nargs='?',
+                             help='input file, defaults to the standard input')
+        command.add_argument('-o', '--output',
+                             help='output file, defaults to the standard '
+                                  'output')
+        return command
+
+    def add_workers(command):
+        command.add_argument('--workers', type=int, default=1,
+                             help='number of worker processes, 0 for the '
+                                  'number of CPUs')
+        command.add_argument('--batch-size', type=int, default=1000,
+                             help='number of records per batch')
+
+    command = add_command('csv', _csv, 'reshape columns of a CSV file')
+    command.add_argument('--columns', required=True,
+                         help='comma separated names or indexes of the '
+                              'columns to reshape')
+    command.add_argument('--delimiter', default=',')
+    command.add_argument('--encoding', default='utf-8')
+    command.add_argument('--no-header', dest='header', action='store_false',
+                         default=None,
+                         help="the first row isn't a header")
+    add_workers(command)
+
+    command = add_command('jsonl', _jsonl,
+                          'reshape fields of a JSON Lines file')
+    command.add_argument('--paths', required=True,
+                         help='comma separated dotted paths of the fields to '
+                              'reshape, like user.name')
+    add_workers(command)
+
+    add_command('catalog', _catalog,
+                'compile a gettext .po or .mo catalog into a reshaped .mo '
+                'catalog')
+
+    command = commands.add_parser(
+        'subtitles', help='reshape the cues of SubRip or WebVTT files'
+    )
+    command.set_defaults(function=_subtitles)
+    command.add_argument('inputs', nargs='*',
+                         help='input files, defaults to the standard input')
+    command.add_argument('-o', '--output',
+                         help='output file, or output directory for several '
+                              'files, defaults to the standard output')
+    command.add_argument('--encoding', default='utf-8')
+    command.add_argument('--workers', type=int, default=0,
+                         help='number of worker processes for several '
+                              'files, 0 for the number of CPUs')
+
+    args = parser.parse_args(argv)
+    if getattr(args, 'workers', None) == 0:
+        args.workers = None
+
+    reshaper = ArabicReshaper(configuration_file=args.configuration_file)
+    args.function(args, reshaper)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,11 +8,17 @@
 # Website: http://mpcabd.xyz
 
 import re
+import sys
+import unicodedata
 
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
 from itertools import repeat
 
 from .ligatures import LIGATURES
 from .reshaper_config import auto_config
+from .templates import CompiledTemplate
 from .letters import (UNSHAPED, ISOLATED, TATWEEL, ZWJ, LETTERS_ARABIC,
                       LETTERS_ARABIC_V2, LETTERS_KURDISH, FINAL,
                       INITIAL, MEDIAL, connects_with_letters_before_and_after,
@@ -34,6 +40,171 @@ HARAKAT_RE = re.compile(
     re.UNICODE | re.X
 )
 
+# Form of the characters that are not letters or are already replaced, it
+# fits in a byte along with the other forms
+NOT_SUPPORTED = 254
+
+# Translation of a forms buffer between the two markers of the isolated form
+ISOLATED_FORMS_SWAP = bytes(
+    UNSHAPED if form == ISOLATED else ISOLATED if form == UNSHAPED else form
+    for form in range(256)
+)
+
+ZWJ_CODE = ord(ZWJ)
+
+# Glyph of the characters that are removed from the output, it can't be a
+# codepoint
+REMOVED = 0xFFFFFFFF
+
+CODEPOINTS_ENCODING = ('utf-32-le' if sys.byteorder == 'little'
+                       else 'utf-32-be')
+
+
+def _decode_glyphs(glyphs):
+    if REMOVED in glyphs:
+        glyphs = array('I', filter(REMOVED.__ne__, glyphs))
+    return glyphs.tobytes().decode(CODEPOINTS_ENCODING, 'surrogatepass')
+
+
+def _letter_forms_for_glyphs(letters, font_glyphs):
+    # Resolve once, for every letter and form, the best character the font
+    # can render: the presentation form, otherwise the unshaped letter
+    return {
+        letter: tuple(
+            form if not form or ord(form) in font_glyphs else letter
+            for form in forms
+        )
+        for letter, forms in letters.items()
+    }
+
+
+# The glyph codes of the letters tables, by the id of the table
+_GLYPH_CODES = {}
+
+# Runs of the characters of a character class, see `_arabic_runs_re`
+RUNS_PATTERN = '.?[{0}]+(?:.[{0}]+)*.?'
+
+# The breaks between the words of a run, for the lexicon
+WORD_BREAKS_RE = re.compile('([ \n])')
+
+# Spans of UTF-8 encoded text that may need reshaping: every Arabic character
+# takes 2 or 3 bytes, so ASCII bytes are copied as is, except for one on each
+# side of a span and a single one between two spans, as in `_arabic_runs_re`
+UTF8_RUNS_RE = re.compile(
+    b'[\x00-\x7f]?[\x80-\xff]+(?:[\x00-\x7f][\x80-\xff]+)*[\x00-\x7f]?'
+)
+
+# Number of enabled ligatures from which they are found with a trie rather
+# than with the regular expression
+LIGATURES_TRIE_MIN_PATTERNS = 32
+
+# Number of variants with overridden options each reshaper keeps
+VARIANTS_CACHE_SIZE = 32
+
+# Default number of characters `reshape_to` writes at once
+SEGMENT_SIZE = 64 * 1024
+
+# Default number of characters `reshape_parallel` sends to a worker at once
+CHUNK_SIZE = 1024 * 1024
+
+# The reshapers of the worker processes, by the arguments they were created
+# with
+_WORKER_RESHAPERS = {}
+
+# Consecutive Harakat, which are kept together as one cluster
+HARAKAT_CLUSTERS_RE = re.compile(HARAKAT_RE.pattern + '+', re.UNICODE | re.X)
+
+
+def _split_harakat(text):
+    # Split the clusters of Harakat out of `text`, returning the letters, the
+    # number of letters before each cluster and the spans of the clusters in
+    # `text`
+    letters = []
+    indices = array('i')
+    spans = array('i')
+    position = 0
+    removed = 0
+    for match in HARAKAT_CLUSTERS_RE.finditer(text):
+        start, end = match.span()
+        letters.append(text[position:start])
+        indices.append(start - removed)
+        spans.extend((start, end))
+        removed += end - start
+        position = end
+    letters.append(text[position:])
+    return ''.join(letters), indices, spans
+
+
+def _expand_ligature_pattern(pattern):
+    # The texts a ligature pattern matches, in the order the regular
+    # expression tries them, or None if it uses anything other than
+    # characters, character classes and groups of alternatives
+    def alternatives(i):
+        texts, i = sequence(i)
+        while i < len(pattern) and pattern[i] == '|':
+            more, i = sequence(i + 1)
+            texts.extend(more)
+        return texts, i
+
+    def sequence(i):
+        texts = ['']
+        while i < len(pattern) and pattern[i] not in '|)':
+            if pattern[i] == '(':
+                i += 3 if pattern.startswith('(?:', i) else 1
+                items, i = alternatives(i)
+                if i == len(pattern):
+                    raise ValueError(pattern)
+                i += 1
+            elif pattern[i] == '[':
+                end = pattern.index(']', i)
+                items = list(pattern[i + 1:end])
+                if not items or set(items) & set('^-\\['):
+                    raise ValueError(pattern)
+                i = end + 1
+            elif pattern[i] in '\\.*+?{}^$]':
+                raise ValueError(pattern)
+            else:
+                items = [pattern[i]]
+                i += 1
+            texts = [text + item for text in texts for item in items]
+        return texts, i
+
+    try:
+        texts, i = alternatives(0)
+    except ValueError:
+        return None
+    if i < len(pattern) or '' in texts:
+        return None
+    return texts
+
+
+def _match_ligatures(trie, text, starts):
+    # Find the ligatures in `text` the same way `re.finditer` finds them with
+    # the alternation of all the ligature patterns: from left to right, only
+    # trying the positions in `starts`, and at each position the match of the
+    # first pattern, and the first of its alternatives. Each node of `trie`
+    # maps the next letter to a node, and '' to the (priority, group index)
+    # of the ligature ending there
+    matches = []
+    end = 0
+    for start in starts:
+        if start < end:
+            continue
+        best = None
+        node = trie
+        for position in range(start, len(text)):
+            node = node.get(text[position])
+            if node is None:
+                break
+            ligature = node.get('')
+            if ligature is not None and (best is None or
+                                         ligature[0] < best[0]):
+                best = (ligature[0], position + 1, ligature[1])
+        if best is not None:
+            end = best[1]
+            matches.append((start, end, best[2]))
+    return matches
+
 
 class ArabicReshaper(object):
     """
@@ -53,9 +224,29 @@ class ArabicReshaper(object):
 
     See the default configuration file :file:`default-config.ini` for details
     on how to configure your reshaper.
+
+    If `font_glyphs` is passed, it should be the codepoints supported by the
+    font the text will be rendered with (see `glyphs_for_true_type_font`),
+    then each letter will fall back to its unshaped form only for the forms
+    the font is missing.
+
+    Options can also be overridden for a single call to `reshape`, the
+    reshapers for the overridden options are kept, so only the first call
+    with each set of overrides pays for creating one.
+
+    Extra ligatures can be passed as `ligatures` or registered later with
+    `add_ligatures`.
+
+    If `cache` is passed, like a `SharedResultCache`, `reshape` looks the
+    texts up in it before reshaping them, and stores the ones it reshapes.
+
+    If `lexicon` is passed, it's the path of a lexicon built with
+    `build_lexicon` for the same configuration, the words found in it are not
+    reshaped again.
     """
 
-    def __init__(self, configuration=None, configuration_file=None):
+    def __init__(self, configuration=None, configuration_file=None,
+                 font_glyphs=None, ligatures=None, cache=None, lexicon=None):
         super(ArabicReshaper, self).__init__()
 
         self.configuration = auto_config(configuration, configuration_file)
@@ -68,24 +259,149 @@ class ArabicReshaper(object):
         else:
             self.letters = LETTERS_ARABIC
 
+        self._font_glyphs = font_glyphs
+        if font_glyphs is None:
+            self._letter_forms = self.letters
+        else:
+            self._letter_forms = _letter_forms_for_glyphs(self.letters,
+                                                          set(font_glyphs))
+        # The glyphs of the letters tables are shared by their reshapers
+        self._glyph_codes = (
+            _GLYPH_CODES.get(id(self._letter_forms))
+            if font_glyphs is None else None
+        )
+        if self._glyph_codes is None:
+            self._glyph_codes = {
+                letter: tuple(ord(form) if form else REMOVED
+                              for form in forms)
+                for letter, forms in self._letter_forms.items()
+            }
+            if font_glyphs is None:
+                _GLYPH_CODES[id(self._letter_forms)] = self._glyph_codes
+
+        self._cache = cache
+
+        self._extra_ligatures = []
+        self._extra_ligatures_characters = set()
+        if ligatures:
+            self.add_ligatures(ligatures)
+
+        self._lexicon = None
+        if lexicon is not None:
+            self.load_lexicon(lexicon)
+
+    def add_ligatures(self, ligatures):
+        """
+        Register extra ligatures, an iterable of
+        `(match, (isolated, initial, medial, final))` records in the format
+        of the replacements of `LIGATURES`: `match` is a regular expression
+        without capturing groups, and the forms are the replacements for each
+        form of the match, a single character (usually a glyph of the font,
+        like one in the Private Use Area) or '' for none.
+
+        They are always enabled, unless `support_ligatures` is False, and
+        take precedence over the built-in ligatures, in the order they are
+        registered. They are replaced in the same pass as the built-in ones.
+        """
+        records = []
+        for match, forms in ligatures:
+            forms = tuple(forms)
+            if len(forms) != 4:
+                raise ValueError(
+                    'Ligature {!r} should have 4 forms'.format(match)
+                )
+            if any(len(form) > 1 for form in forms):
+                raise ValueError(
+                    'The forms of ligature {!r} should be single characters '
+                    "or ''".format(match)
+                )
+            pattern = re.compile(match, re.UNICODE)
+            if pattern.groups:
+                raise ValueError(
+                    'Ligature {!r} has capturing groups, use (?:...) '
+                    'instead'.format(match)
+                )
+            if pattern.match(''):
+                raise ValueError(
+                    'Ligature {!r} matches an empty string'.format(match)
+                )
+            records.append((match, forms))
+
+        for match, forms in records:
+            # Like in the sentence ligatures, runs take in the single spaces
+            # between words, other spaces have to start runs
+            texts = _expand_ligature_pattern(match) or [match]
+            for text in texts:
+                self._extra_ligatures_characters.update(text.replace(' ', ''))
+                if (text.startswith(' ') or text.endswith(' ') or
+                        '  ' in text):
+                    self._extra_ligatures_characters.add(' ')
+        self._extra_ligatures.extend(records)
+
+        # Everything derived from the ligatures is built again when used
+        for name in ('_ArabicReshaper__ligatures_re',
+                     '_re_group_index_to_ligature_forms',
+                     '_ligatures_characters',
+                     '_ArabicReshaper__ligatures_trie',
+                     '_ArabicReshaper__reshaped_characters',
+                     '_ArabicReshaper__arabic_runs_re',
+                     '_ArabicReshaper__segment_breaks_re',
+                     '_batch_reshaper',
+                     '_variants',
+                     '_ArabicReshaper__configuration_digest',
+                     '_ArabicReshaper__unsafe_word_breaks_re',
+                     '_ArabicReshaper__unreshape_table'):
+            self.__dict__.pop(name, None)
+        # The shapes of the lexicon may not have these ligatures
+        self._lexicon = None
+
+    def load_lexicon(self, path):
+        """
+        Load the lexicon at `path`, built with `build_lexicon`, `reshape`
+        then takes the shapes of the words it has from it. Raises ValueError
+        if the lexicon was built for another configuration.
+        """
+        from .lexicon import read_lexicon
+
+        digest, lexicon = read_lexicon(path)
+        if digest != self._configuration_digest:
+            raise ValueError(
+                'Lexicon {} was built for another configuration'.format(path)
+            )
+        self._lexicon = lexicon
+
+    def _enabled_ligatures(self):
+        # The (match, forms) records of the ligatures to replace, in order of
+        # precedence
+        records = list(self._extra_ligatures)
+        records.extend(
+            replacement for ligature, replacement in LIGATURES
+            if self.configuration.getboolean(ligature)
+        )
+        return records
+
     @property
     def _ligatures_re(self):
-        if not hasattr(self, '__ligatures_re'):
+        # `self.__ligatures_re` is name mangled, so it has to be looked up
+        # with its mangled name for the compiled expression to be reused
+        if not hasattr(self, '_ArabicReshaper__ligatures_re'):
             patterns = []
             re_group_index_to_ligature_forms = {}
+            characters = set()
             index = 0
             FORMS = 1
             MATCH = 0
-            for ligature_record in LIGATURES:
-                ligature, replacement = ligature_record
-                if not self.configuration.getboolean(ligature):
-                    continue
+            for replacement in self._enabled_ligatures():
                 re_group_index_to_ligature_forms[index] = replacement[FORMS]
                 patterns.append('({})'.format(replacement[MATCH]))
+                # Includes the regular expression syntax too, which is fine
+                # as it is only used to know which characters to reshape
+                characters.update(replacement[MATCH])
                 index += 1
             self._re_group_index_to_ligature_forms = (
                 re_group_index_to_ligature_forms
             )
+            self._ligatures_characters = characters
             self.__ligatures_re = re.compile('|'.join(patterns), re.UNICODE)
         return self.__ligatures_re
 
@@ -94,105 +410,759 @@ class ArabicReshaper(object):
             return self._ligatures_re
         return self._re_group_index_to_ligature_forms[group_index]
 
-    def reshape(self, text):
+    @property
+    def _ligatures_trie(self):
+        if not hasattr(self, '_ArabicReshaper__ligatures_trie'):
+            # The texts of all the enabled ligatures in a trie, for
+            # `_match_ligatures`. The regular expression tries every pattern
+            # at every position, which is faster for a few patterns only, so
+            # it's used (the trie is None) below LIGATURES_TRIE_MIN_PATTERNS
+            # or when a pattern can't be expanded to its texts
+            self._ligatures_re
+            trie = {}
+            priority = 0
+            group_index = 0
+            for match, forms in self._enabled_ligatures():
+                texts = _expand_ligature_pattern(match)
+                if texts is None:
+                    trie = None
+                    break
+                for text in texts:
+                    node = trie
+                    for letter in text:
+                        node = node.setdefault(letter, {})
+                    node.setdefault('', (priority, group_index))
+                    priority += 1
+                group_index += 1
+            if group_index < LIGATURES_TRIE_MIN_PATTERNS:
+                trie = None
+            self.__ligatures_trie = trie
+        return self.__ligatures_trie
+
+    @property
+    def _reshaped_characters(self):
+        if not hasattr(self, '_ArabicReshaper__reshaped_characters'):
+            # Characters that take part in reshaping, as the content of a
+            # regular expression character class, everything else is copied
+            # as is
+            characters = set(self.letters)
+            characters.update((TATWEEL, ZWJ))
+            if self.configuration.getboolean('support_ligatures'):
+                # Leaving out the ASCII characters of the ligatures, which
+                # are either the regular expression syntax or the single
+                # spaces between the words of a sentence ligature, that runs
+                # already take in, otherwise every space of a Latin text would
+                # start a run
+                self._ligatures_re
+                characters.update(
+                    c for c in self._ligatures_characters if ord(c) > 0x7f
+                )
+                # The registered ligatures may have any character
+                characters.update(self._extra_ligatures_characters)
+            self.__reshaped_characters = ''.join(sorted(
+                re.escape(c) for c in characters
+            )) + HARAKAT_RE.pattern[1:-1]
+        return self.__reshaped_characters
+
+    @property
+    def _arabic_runs_re(self):
+        if not hasattr(self, '_ArabicReshaper__arabic_runs_re'):
+            # A run takes one more character on each side, so Harakat and
+            # ZWJs at its edges attach to the same characters they would
+            # when reshaping the whole text, and runs separated by a single
+            # character are merged
+            self.__arabic_runs_re = re.compile(
+                RUNS_PATTERN.format(self._reshaped_characters),
+                re.UNICODE | re.DOTALL
+            )
+        return self.__arabic_runs_re
+
+    @property
+    def _segment_breaks_re(self):
+        if not hasattr(self, '_ArabicReshaper__segment_breaks_re'):
+            # The text can be cut after a character that doesn't take part in
+            # reshaping and can't be part of a ligature, like the spaces of
+            # sentence ligatures, so no letter joins and no ligature matches
+            # across the cut, unless the next character is a haraka, a ZWJ or
+            # a Tatweel, whose position in the output depends on the
+            # characters before them. The parts are then reshaped exactly as
+            # they would be in the whole text
+            characters = self._reshaped_characters
+            if self.configuration.getboolean('support_ligatures'):
+                characters += ''.join(sorted(
+                    re.escape(c) for c in self._ligatures_characters
+                    if ord(c) <= 0x7f
+                ))
+            self.__segment_breaks_re = re.compile(
+                '[^{}](?![{}{}{}])'.format(
+                    characters, HARAKAT_RE.pattern[1:-1], ZWJ, TATWEEL
+                ),
+                re.UNICODE | re.DOTALL
+            )
+        return self.__segment_breaks_re
+
+    @property
+    def _unsafe_word_breaks_re(self):
+        if not hasattr(self, '_ArabicReshaper__unsafe_word_breaks_re'):
+            # Matches where a run can't be cut at its spaces and line breaks
+            # into words that are reshaped alone: a haraka, a ZWJ or a
+            # Tatweel after a break, which are placed after the characters
+            # before them, Harakat (or deleted Tatweels) after a ZWJ before a
+            # break, which are placed after the characters after them, or a
+            # ligature with breaks
+            harakat = HARAKAT_RE.pattern[1:-1]
+            patterns = [
+                '[ \n][{}{}{}]'.format(harakat, ZWJ, TATWEEL),
+                '{}[{}{}]*[ \n]'.format(ZWJ, harakat, TATWEEL),
+            ]
+            if self.configuration.getboolean('support_ligatures'):
+                patterns.extend(
+                    '(?:{})'.format(match)
+                    for match, forms in self._enabled_ligatures()
+                    if any(' ' in text or '\n' in text for text in
+                           _expand_ligature_pattern(match) or [match])
+                )
+            self.__unsafe_word_breaks_re = re.compile('|'.join(patterns),
+                                                      re.UNICODE)
+        return self.__unsafe_word_breaks_re
+
+    def _run_words(self, text):
+        # The words of a run that can be reshaped one by one with the same
+        # result, each followed by the break after it, or None
+        if self._unsafe_word_breaks_re.search(text):
+            return None
+        return WORD_BREAKS_RE.split(text)
+
+    @property
+    def _options(self):
+        if not hasattr(self, '_ArabicReshaper__options'):
+            # Reading the configuration takes longer than reshaping a short
+            # string, so it's read once
+            self.__options = (
+                self.configuration.getboolean('delete_harakat'),
+                self.configuration.getboolean('delete_tatweel'),
+                self.configuration.getboolean('support_zwj'),
+                self.configuration.getboolean('shift_harakat_position'),
+                self.configuration.getboolean(
+                    'use_unshaped_instead_of_isolated'
+                ),
+                self.configuration.getboolean('support_ligatures'),
+            )
+        return self.__options
+
+    @property
+    def _deleted_characters_re(self):
+        if not hasattr(self, '_ArabicReshaper__deleted_characters_re'):
+            # Characters dropped from the text before reshaping it, they
+            # don't affect the forms of the letters around them
+            characters = ''
+            if self.configuration.getboolean('delete_harakat'):
+                characters += HARAKAT_RE.pattern[1:-1]
+            if self.configuration.getboolean('delete_tatweel'):
+                characters += TATWEEL
+            if not self.configuration.getboolean('support_zwj'):
+                characters += ZWJ
+            self.__deleted_characters_re = (
+                re.compile('[{}]'.format(characters), re.UNICODE)
+                if characters else None
+            )
+        return self.__deleted_characters_re
+
+    @property
+    def _configuration_digest(self):
+        # A digest of everything the reshaped text depends on, the keys of
+        # the texts in the cache start with it, so reshapers with other
+        # configurations can share the cache, and lexicons are tied to it
+        if not hasattr(self, '_ArabicReshaper__configuration_digest'):
+            import hashlib
+            self.__configuration_digest = hashlib.blake2b(repr((
+                sorted(self.configuration.items()),
+                self._extra_ligatures,
+                sorted(self._font_glyphs or ()),
+            )).encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+        return self.__configuration_digest
+
+    def _variant(self, overrides):
+        # The reshaper with `overrides` applied to this one's configuration,
+        # the least recently used variants are dropped past
+        # VARIANTS_CACHE_SIZE
+        if not hasattr(self, '_variants'):
+            self._variants = OrderedDict()
+        key = frozenset(overrides.items())
+        variant = self._variants.get(key)
+        if variant is None:
+            # The names of the options are normalized like ConfigParser does,
+            # so the ligatures can be given by their names
+            optionxform = self.configuration.parser.optionxform
+            configuration = dict(self.configuration)
+            configuration.update(
+                (optionxform(option), value)
+                for option, value in overrides.items()
+            )
+            variant = ArabicReshaper(configuration,
+                                     font_glyphs=self._font_glyphs,
+                                     ligatures=self._extra_ligatures,
+                                     cache=self._cache)
+            self._variants[key] = variant
+            if len(self._variants) > VARIANTS_CACHE_SIZE:
+                self._variants.popitem(last=False)
+        else:
+            self._variants.move_to_end(key)
+        return variant
+
+    def reshape(self, text, **overrides):
+        """
+        Reshape `text`, keyword arguments override the options of the
+        configuration for this call only, for example
+        `reshape(text, delete_harakat=False)`.
+        """
+        if overrides:
+            return self._variant(overrides).reshape(text)
         if not text:
             return ''
 
-        output = []
+        runs = [match.span() for match in self._arabic_runs_re.finditer(text)]
+        if not runs:
+            return text
+
+        cache = self._cache
+        if cache is None:
+            return self._reshape_runs(text, runs)
+        key = (self._configuration_digest +
+               text.encode('utf-8', 'surrogatepass'))
+        reshaped = cache.get(key)
+        if reshaped is None:
+            reshaped = self._reshape_runs(text, runs)
+            cache.set(key, reshaped)
+        return reshaped
+
+    def _reshape_runs(self, text, runs):
+        options = self._options
+
+        # Only the runs of characters that take part in reshaping go through
+        # the reshaping loop, the text between them is copied as is
+        result = []
+        position = 0
+        for start, end in runs:
+            if position < start:
+                result.append(text[position:start])
+            self._reshape_run(text[start:end], options, result)
+            position = end
+        if position < len(text):
+            result.append(text[position:])
+
+        return ''.join(result)
+
+    def unreshape(self, text):
+        """
+        Replace the presentation forms and the ligatures in `text` with the
+        letters they stand for, undoing `reshape`. The Harakat and the
+        Tatweels it deleted can't be brought back, nor the positions of the
+        Harakat it shifted, and a form shared by two letters, like the medial
+        form of Heh and Heh Doachashmee in Kurdish, is replaced with the
+        letter Unicode encodes it for.
+        """
+        return text.translate(self._unreshape_table)
+
+    @property
+    def _unreshape_table(self):
+        if not hasattr(self, '_ArabicReshaper__unreshape_table'):
+            # The letters of every form this reshaper can write, the extra
+            # ligatures first as they take precedence, then the letters and
+            # all the built-in ligatures, enabled or not. A form shared by
+            # several letters goes back to the letter it's encoded for
+            table = {}
+            letters = sorted(
+                ((form, letter) for letter, forms in self._letter_forms.items()
+                 for form in forms),
+                key=lambda item: unicodedata.normalize('NFKC', item[0]) !=
+                item[1]
+            )
+            records = [(match, forms)
+                       for match, forms in self._extra_ligatures]
+            records.extend((letter, (form,)) for form, letter in letters)
+            records.extend(replacement for _, replacement in LIGATURES)
+            for match, forms in records:
+                texts = _expand_ligature_pattern(match) or [match]
+                for form in forms:
+                    if len(form) == 1 and form != texts[0]:
+                        table.setdefault(ord(form), texts[0])
+            self.__unreshape_table = table
+        return self.__unreshape_table
+
+    def compile_template(self, template):
+        """
+        Compile `template`, a format string like `'مرحبا {name}'`, into a
+        `CompiledTemplate` whose `format` method returns the same as
+        `reshape(template.format(...))`.
+
+        The literal text of the template is reshaped once, only the values
+        and the characters of the literal text that may join them are
+        reshaped when rendering. The template has to be compiled again after
+        `add_ligatures`.
+        """
+        return CompiledTemplate(self, template)
+
+    def reshape_variants(self, text, configurations):
+        """
+        Reshape `text` for each of `configurations` and return the list of
+        the results. Each configuration is either a dict of options
+        overriding the ones of this reshaper, like the keyword arguments of
+        `reshape`, or an `ArabicReshaper`.
+
+        The characters are classified and the letters are joined only once
+        for all the configurations with the same language, `delete_tatweel`
+        and `support_zwj`, then the forms, the ligatures and the Harakat are
+        written for each configuration.
+        """
+        reshapers = [
+            configuration if isinstance(configuration, ArabicReshaper)
+            else self._variant(configuration) if configuration
+            else self
+            for configuration in configurations
+        ]
+        groups = OrderedDict()
+        for reshaper in OrderedDict(
+                (id(reshaper), reshaper) for reshaper in reshapers).values():
+            options = reshaper._options
+            key = (id(reshaper.letters), options[1], options[2])
+            groups.setdefault(key, []).append(reshaper)
+
+        results = {}
+        for group in groups.values():
+            for reshaper, result in zip(group, _reshape_group(text, group)):
+                results[id(reshaper)] = result
+        return [results[id(reshaper)] for reshaper in reshapers]
 
-        LETTER = 0
-        FORM = 1
-        NOT_SUPPORTED = -1
+    def reshape_to(self, text, sink, segment_size=SEGMENT_SIZE):
+        """
+        Reshape `text` and write the result to `sink`, which is either an
+        object with a `write` method, like a file or a socket wrapper, or a
+        callable.
 
-        delete_harakat = self.configuration.getboolean('delete_harakat')
-        delete_tatweel = self.configuration.getboolean('delete_tatweel')
-        support_zwj = self.configuration.getboolean('support_zwj')
-        shift_harakat_position = self.configuration.getboolean(
-            'shift_harakat_position'
+        The result is written in segments of about `segment_size`
+        characters as soon as each one is reshaped, instead of building the
+        whole result in memory first. The text is only cut where it doesn't
+        change the result, so text without such places, like a single long
+        line of Arabic with no punctuation, is written in one segment.
+        `text` can also be an iterable of strings, see `iter_reshape`.
+        """
+        write = getattr(sink, 'write', sink)
+        for segment in self.iter_reshape(text, segment_size):
+            write(segment)
+
+    def iter_reshape(self, text, segment_size=SEGMENT_SIZE):
+        """
+        Reshape `text` and yield the result in segments of about
+        `segment_size` characters, each one as soon as it's reshaped, so it
+        can be sent before the rest of the text is reshaped.
+
+        `text` can also be an iterable of strings, like the chunks of a
+        request body, a segment is then yielded once the text that follows
+        it can't change it anymore, and the text after the last such place
+        waits for the next strings.
+        """
+        if isinstance(text, str):
+            for segment in self._segments(text, segment_size):
+                yield self.reshape(segment)
+            return
+
+        # The strings are only joined once there is another segment's worth
+        # of text after what was searched before
+        breaks_re = self._segment_breaks_re
+        chunks = []
+        size = 0
+        searched = 0
+        for chunk in text:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size < searched + segment_size:
+                continue
+            pending = ''.join(chunks)
+            position = 0
+            while True:
+                match = breaks_re.search(
+                    pending, max(searched, position + segment_size - 1)
+                )
+                # A break at the end of the text isn't one until the next
+                # character is known
+                if match is None or match.end() == len(pending):
+                    break
+                yield self.reshape(pending[position:match.end()])
+                position = match.end()
+            pending = pending[position:]
+            chunks = [pending]
+            size = len(pending)
+            searched = max(size - 1, 0)
+        pending = ''.join(chunks)
+        if pending:
+            yield self.reshape(pending)
+
+    def reshape_parallel(self, text, workers=None, chunk_size=CHUNK_SIZE):
+        """
+        Reshape a large `text` in chunks of about `chunk_size` characters,
+        using a pool of `workers` processes (defaults to the number of CPUs,
+        `1` disables the pool).
+
+        The text is only cut where it doesn't change the result, like
+        `reshape_to` does, so the result is the same as `reshape`'s.
+        """
+        chunks = list(self._segments(text, chunk_size))
+        if workers == 1 or len(chunks) < 2:
+            return self.reshape(text)
+
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return ''.join(executor.map(
+                _reshape_chunk, chunks, repeat(self._worker_arguments)
+            ))
+
+    def _segments(self, text, segment_size):
+        # Cut `text` into segments of about `segment_size` characters that
+        # are reshaped as they would be in the whole text
+        breaks_re = self._segment_breaks_re
+        position = 0
+        while position < len(text):
+            match = breaks_re.search(
+                text, max(position, position + segment_size - 1)
+            )
+            end = match.end() if match else len(text)
+            yield text[position:end]
+            position = end
+
+    @property
+    def _reshapes_ascii(self):
+        # Whether text with only ASCII characters may change, when they are
+        # part of registered ligatures
+        return bool(
+            self._extra_ligatures_characters and
+            self.configuration.getboolean('support_ligatures') and
+            min(map(ord, self._extra_ligatures_characters)) <= 0x7f
         )
-        use_unshaped_instead_of_isolated = self.configuration.getboolean(
-            'use_unshaped_instead_of_isolated'
+
+    @property
+    def _worker_arguments(self):
+        # What a worker process needs to create the same reshaper, as a
+        # hashable tuple
+        return (
+            tuple(sorted(self.configuration.items())),
+            (None if self._font_glyphs is None
+             else tuple(sorted(self._font_glyphs))),
+            tuple((match, tuple(forms))
+                  for match, forms in self._extra_ligatures),
         )
 
-        positions_harakat = {}
+    def reshape_runs(self, runs):
+        """
+        Reshape `runs`, a list of `(text, style)` pairs like the runs of a
+        rich-text paragraph, as one text, so the letters join and the
+        ligatures form across the runs, and return the list of the reshaped
+        `(text, style)` pairs, with the same styles.
+
+        A ligature goes to the run of its first letter, and Harakat go to the
+        run of the letter they're written after.
+        """
+        runs = list(runs)
+        text = ''.join(run_text for run_text, style in runs)
+        options = self._options
+
+        # Each character of the result comes with the position in `text` it
+        # comes from, which only grows along the result
+        result = []
+        sources = array('I')
+        position = 0
+        for match in self._arabic_runs_re.finditer(text):
+            start, end = match.span()
+            if position < start:
+                result.append(text[position:start])
+                sources.extend(range(position, start))
+            joined = self._join_run(text[start:end], options)
+            clusters = []
+            self._write_run(joined, options, result, clusters)
+            sources.extend(
+                start + source for source in
+                self._run_sources(text[start:end], joined, clusters)
+            )
+            position = end
+        if position < len(text):
+            result.append(text[position:])
+            sources.extend(range(position, len(text)))
+        reshaped = ''.join(result)
+
+        reshaped_runs = []
+        run_start = 0
+        start = 0
+        for run_text, style in runs:
+            run_start += len(run_text)
+            end = bisect_left(sources, run_start)
+            reshaped_runs.append((reshaped[start:end], style))
+            start = end
+        return reshaped_runs
+
+    def _run_sources(self, text, joined, clusters):
+        # The position in the run `text` each character `_write_run` wrote
+        # comes from: a ligature comes from its first letter, and the Harakat
+        # from the letter they're written after
+        letters, harakat, has_zwj, forms, glyphs, _ = joined
+        positions = range(len(text))
+        deleted_characters_re = self._deleted_characters_re
+        if deleted_characters_re is not None:
+            deleted = set()
+            for match in deleted_characters_re.finditer(text):
+                deleted.update(range(*match.span()))
+            positions = [i for i in positions if i not in deleted]
+        if harakat is not None:
+            spans = harakat[2]
+            letters_positions = []
+            previous_end = 0
+            for start, end in zip(spans[::2], spans[1::2]):
+                letters_positions.extend(positions[previous_end:start])
+                previous_end = end
+            letters_positions.extend(positions[previous_end:])
+            positions = letters_positions
+        if has_zwj:
+            positions = [position for position, letter
+                         in zip(positions, letters) if letter != ZWJ]
+
+        marks = {}
+        for position, length in clusters:
+            marks[position] = marks.get(position, 0) + length
+        sources = [0] * marks.get(-1, 0)
+        for i, glyph in enumerate(glyphs):
+            if glyph != REMOVED:
+                sources.append(positions[i])
+            if i in marks:
+                sources.extend([positions[i]] * marks[i])
+        return sources
+
+    def reshape_bytes(self, data):
+        """
+        Reshape UTF-8 encoded `data` (bytes, bytearray or memoryview) and
+        return the UTF-8 encoded result.
+        """
+        return b''.join(self._reshape_utf8(data))
+
+    def reshape_into(self, data, out):
+        """
+        Reshape UTF-8 encoded `data` (bytes, bytearray or memoryview) and
+        write the UTF-8 encoded result at the start of the bytearray `out`,
+        which only grows when the result doesn't fit, so the same buffer can
+        be reused for many calls. Like `readinto`, returns the number of bytes
+        written, the bytes of `out` after them are left as they were.
+        """
+        position = 0
+        for chunk in self._reshape_utf8(data):
+            end = position + len(chunk)
+            out[position:end] = chunk
+            position = end
+        return position
+
+    def _reshape_utf8(self, data):
+        # Only the spans with non-ASCII characters are decoded, the rest of
+        # the bytes are yielded as slices of `data`
+        data = memoryview(data)
+        if self._reshapes_ascii:
+            # ASCII text may be part of the registered ligatures, so none of
+            # it can be skipped
+            text = str(data, 'utf-8')
+            reshaped = self.reshape(text)
+            yield data if reshaped is text else reshaped.encode('utf-8')
+            return
+        position = 0
+        for match in UTF8_RUNS_RE.finditer(data):
+            start, end = match.span()
+            if position < start:
+                yield data[position:start]
+            text = str(data[start:end], 'utf-8')
+            reshaped = self.reshape(text)
+            yield (data[start:end] if reshaped is text
+                   else reshaped.encode('utf-8'))
+            position = end
+        if position < len(data):
+            yield data[position:]
+
+    def _reshape_run(self, text, options, result):
+        lexicon = self._lexicon
+        words = self._run_words(text) if lexicon else None
+        if words is None:
+            self._write_run(self._join_run(text, options), options, result)
+            return
+        # The words found in the lexicon are copied from it
+        for i, word in enumerate(words):
+            if i % 2:
+                result.append(word)
+                continue
+            shaped = lexicon.get(word)
+            if shaped is not None:
+                result.append(shaped)
+            elif word:
+                self._write_run(self._join_run(word, options), options,
+                                result)
+
+    def _join_run(self, text, options):
+        # Classify the characters and join the letters, returning the text of
+        # the letters, the Harakat kept aside (or None), whether ZWJs are
+        # supported in it, the forms, the glyphs and the positions where a
+        # ligature may start (or None)
+        #
+        # The output is kept in two parallel compact buffers instead of a
+        # list of (letter, form) tuples: the forms of the letters and the
+        # codepoints they will be written as
+        forms = bytearray()
+        glyphs = array('I')
+
+        (delete_harakat, delete_tatweel, support_zwj, shift_harakat_position,
+         use_unshaped_instead_of_isolated, support_ligatures) = options
+
+        letters = self.letters
+        glyph_codes = self._glyph_codes
 
         isolated_form = (UNSHAPED
                          if use_unshaped_instead_of_isolated else ISOLATED)
 
+        deleted_characters_re = self._deleted_characters_re
+        if deleted_characters_re is not None:
+            text = deleted_characters_re.sub('', text)
+        harakat = None
+        if not delete_harakat:
+            # The Harakat don't take part in the loop, they are kept aside
+            # as clusters and written back after the letters they follow
+            vocalized_text = text
+            text, harakat_indices, harakat_spans = _split_harakat(text)
+            harakat = (vocalized_text, harakat_indices, harakat_spans)
+        has_zwj = support_zwj and ZWJ in text
+
+        # The loop notes the positions of the output where a ligature may
+        # start, the ligatures are only looked for there afterwards
+        ligatures_trie = None
+        ligatures_starts = None
+        if support_ligatures:
+            ligatures_trie = self._ligatures_trie
+            if ligatures_trie is not None:
+                ligatures_starts = array('i')
+
         for letter in text:
-            if HARAKAT_RE.match(letter):
-                if not delete_harakat:
-                    position = len(output) - 1
-                    if shift_harakat_position:
-                        position -= 1
-                    if position not in positions_harakat:
-                        positions_harakat[position] = []
-                    if shift_harakat_position:
-                        positions_harakat[position].insert(0, letter)
-                    else:
-                        positions_harakat[position].append(letter)
-            elif letter == TATWEEL and delete_tatweel:
-                pass
-            elif letter == ZWJ and not support_zwj:
-                pass
-            elif letter not in self.letters:
-                output.append((letter, NOT_SUPPORTED))
-            elif not output:  # first letter
-                output.append((letter, isolated_form))
+            if letter not in letters:
+                forms.append(NOT_SUPPORTED)
+                glyphs.append(ord(letter))
             else:
-                previous_letter = output[-1]
-                if previous_letter[FORM] == NOT_SUPPORTED:
-                    output.append((letter, isolated_form))
-                elif not connects_with_letter_before(letter, self.letters):
-                    output.append((letter, isolated_form))
-                elif not connects_with_letter_after(
-                        previous_letter[LETTER], self.letters):
-                    output.append((letter, isolated_form))
-                elif (previous_letter[FORM] == FINAL and not
+                form = isolated_form
+                if not forms:  # first letter
+                    pass
+                elif forms[-1] == NOT_SUPPORTED:
+                    pass
+                elif not connects_with_letter_before(letter, letters):
+                    pass
+                elif not connects_with_letter_after(previous_letter, letters):
+                    pass
+                elif (forms[-1] == FINAL and not
                       connects_with_letters_before_and_after(
-                          previous_letter[LETTER], self.letters
+                          previous_letter, letters
                 )):
-                    output.append((letter, isolated_form))
-                elif previous_letter[FORM] == isolated_form:
-                    output[-1] = (
-                        previous_letter[LETTER],
-                        INITIAL
-                    )
-                    output.append((letter, FINAL))
-                # Otherwise, we will change the previous letter to connect
-                # to the current letter
+                    pass
                 else:
-                    output[-1] = (
-                        previous_letter[LETTER],
-                        MEDIAL
-                    )
-                    output.append((letter, FINAL))
+                    # We will change the previous letter to connect to the
+                    # current letter
+                    if forms[-1] == isolated_form:
+                        forms[-1] = INITIAL
+                    else:
+                        forms[-1] = MEDIAL
+                    glyphs[-1] = glyph_codes[previous_letter][forms[-1]]
+                    form = FINAL
+
+                forms.append(form)
+                glyphs.append(
+                    ord(letter) if form == UNSHAPED
+                    else glyph_codes[letter][form]
+                )
+
+            previous_letter = letter
 
             # Remove ZWJ if it's the second to last item as it won't be useful
-            if support_zwj and len(output) > 1 and output[-2][LETTER] == ZWJ:
-                output.pop(len(output) - 2)
+            if has_zwj and len(forms) > 1 and glyphs[-2] == ZWJ_CODE:
+                del forms[-2]
+                del glyphs[-2]
+
+            if ligatures_trie and letter in ligatures_trie:
+                ligatures_starts.append(len(forms) - 1)
+
+        if has_zwj and forms and glyphs[-1] == ZWJ_CODE:
+            del forms[-1]
+            del glyphs[-1]
+
+        return text, harakat, has_zwj, forms, glyphs, ligatures_starts
+
+    def _rejoin_run(self, joined, joining):
+        # The run joined by `joining`, another reshaper with the same letters
+        # and deleted characters, with the forms and glyphs of this one: only
+        # the marker of the isolated form and the glyphs of the forms differ
+        text, harakat, has_zwj, forms, glyphs, _ = joined
+        isolated_form = UNSHAPED if self._options[4] else ISOLATED
+        swapped = joining._options[4] != self._options[4]
+        forms = (forms.translate(ISOLATED_FORMS_SWAP) if swapped
+                 else bytearray(forms))
+        # All the ZWJs are dropped from the output, the other characters of
+        # the text are the characters of the output
+        output = text.replace(ZWJ, '') if has_zwj else text
+        glyph_codes = self._glyph_codes
+        if glyph_codes is joining._glyph_codes:
+            glyphs = array('I', glyphs)
+            if swapped:
+                # Only the glyphs of the isolated letters change
+                i = forms.find(isolated_form)
+                while i != -1:
+                    letter = output[i]
+                    glyphs[i] = (ord(letter) if isolated_form == UNSHAPED
+                                 else glyph_codes[letter][ISOLATED])
+                    i = forms.find(isolated_form, i + 1)
+        else:
+            glyphs = array('I', [
+                ord(letter) if form >= NOT_SUPPORTED
+                else glyph_codes[letter][form]
+                for letter, form in zip(output, forms)
+            ])
+        return text, harakat, has_zwj, forms, glyphs, None
 
-        if support_zwj and output and output[-1][LETTER] == ZWJ:
-            output.pop()
+    def _write_run(self, joined, options, result, clusters=None):
+        # Replace the ligatures of a joined run and write it to `result`
+        # with its Harakat, the output letter each cluster of Harakat is
+        # written after and its length are added to `clusters` if given
+        text, harakat, has_zwj, forms, glyphs, ligatures_starts = joined
 
-        if self.configuration.getboolean('support_ligatures'):
-            # Clean text from Harakat to be able to find ligatures
-            text = HARAKAT_RE.sub('', text)
+        (delete_harakat, delete_tatweel, support_zwj, shift_harakat_position,
+         use_unshaped_instead_of_isolated, support_ligatures) = options
 
-            # Clean text from Tatweel to find ligatures if delete_tatweel
-            if delete_tatweel:
-                text = text.replace(TATWEEL, '')
+        isolated_form = (UNSHAPED
+                         if use_unshaped_instead_of_isolated else ISOLATED)
+
+        if support_ligatures:
+            # The ligatures are looked for in the letters of the output,
+            # without the ZWJs that were dropped, so the positions of the
+            # matches are the positions in the output
+            ligatures_text = text.replace(ZWJ, '') if has_zwj else text
+            ligatures_trie = self._ligatures_trie
+            if ligatures_trie is not None:
+                if ligatures_starts is None:
+                    ligatures_starts = [
+                        i for i, letter in enumerate(ligatures_text)
+                        if letter in ligatures_trie
+                    ]
+                matches = _match_ligatures(ligatures_trie, ligatures_text,
+                                           ligatures_starts)
+            else:
+                matches = [
+                    match.span() + (next((
+                        i for i, group in enumerate(match.groups()) if group
+                    ), -1),)
+                    for match in self._ligatures_re.finditer(ligatures_text)
+                ]
 
-            for match in re.finditer(self._ligatures_re, text):
-                group_index = next((
-                    i for i, group in enumerate(match.groups()) if group
-                ), -1)
-                forms = self._get_ligature_forms_from_re_group_index(
+            for a, b, group_index in matches:
+                ligature_forms = self._get_ligature_forms_from_re_group_index(
                     group_index
                 )
-                a, b = match.span()
-                a_form = output[a][FORM]
-                b_form = output[b - 1][FORM]
+                a_form = forms[a]
+                b_form = forms[b - 1]
                 ligature_form = None
 
                 # +-----------+----------+---------+---------+----------+
@@ -214,27 +1184,138 @@ class ArabicReshaper(object):
                         ligature_form = FINAL
                     else:
                         ligature_form = MEDIAL
-                if not forms[ligature_form]:
+                if not ligature_forms[ligature_form]:
                     continue
-                output[a] = (forms[ligature_form], NOT_SUPPORTED)
-                output[a+1:b] = repeat(('', NOT_SUPPORTED), b - 1 - a)
+                glyphs[a] = ord(ligature_forms[ligature_form])
+                forms[a] = NOT_SUPPORTED
+                glyphs[a + 1:b] = array('I', (REMOVED,)) * (b - 1 - a)
 
-        result = []
-        if not delete_harakat and -1 in positions_harakat:
-            result.extend(positions_harakat[-1])
-        for i, o in enumerate(output):
-            if o[LETTER]:
-                if o[FORM] == NOT_SUPPORTED or o[FORM] == UNSHAPED:
-                    result.append(o[LETTER])
-                else:
-                    result.append(self.letters[o[LETTER]][o[FORM]])
+        if delete_harakat or harakat is None or not harakat[2]:
+            result.append(_decode_glyphs(glyphs))
+            return
+        vocalized_text, harakat_indices, harakat_spans = harakat
 
-            if not delete_harakat:
-                if i in positions_harakat:
-                    result.extend(positions_harakat[i])
+        # Write the glyphs in bulk between the clusters of Harakat, each
+        # cluster goes after the output letter that was last when it was read
+        # (the one before it if shifted), where -1 puts it first
+        if has_zwj:
+            # A ZWJ is dropped from the output when the letter after it is
+            # read
+            zwj_indices = [i for i, letter in enumerate(text) if letter == ZWJ]
+        shift = 2 if shift_harakat_position else 1
+        size = len(glyphs)
+        start = 0
+        previous_position = None
+        for index, cluster_start, cluster_end in zip(
+                harakat_indices, harakat_spans[::2], harakat_spans[1::2]):
+            position = index - shift
+            if has_zwj:
+                position -= bisect_left(zwj_indices, index - 1)
+            if position < -1:
+                continue
+            if position >= size:
+                break
+            marks = vocalized_text[cluster_start:cluster_end]
+            if shift_harakat_position:
+                marks = marks[::-1]
+            if clusters is not None:
+                clusters.append((position, len(marks)))
+            if position != previous_position:
+                result.append(_decode_glyphs(glyphs[start:position + 1]))
+                result.append(marks)
+                start = position + 1
+                previous_position = position
+            elif shift_harakat_position:
+                # The marks read later go before the ones already written
+                result[-1] = marks + result[-1]
+            else:
+                result[-1] += marks
+        result.append(_decode_glyphs(glyphs[start:]))
 
-        return ''.join(result)
+
+def _reshape_group(text, reshapers):
+    # Reshape `text` with each of `reshapers`, which have the same letters
+    # and delete the same characters, other than the Harakat, so they join
+    # the letters the same way
+    if len(reshapers) == 1:
+        return [reshapers[0].reshape(text)]
+    if not text:
+        return [''] * len(reshapers)
+
+    # The runs of any of the reshapers, reshaping more of the text than a
+    # reshaper's own runs doesn't change its result
+    runs_re = re.compile(
+        RUNS_PATTERN.format(''.join(sorted(set(
+            reshaper._reshaped_characters for reshaper in reshapers
+        )))),
+        re.UNICODE | re.DOTALL
+    )
+    runs = [match.span() for match in runs_re.finditer(text)]
+    if not runs:
+        return [text] * len(reshapers)
+
+    # The letters are joined by a reshaper that keeps the Harakat aside, if
+    # any does, the others only drop them
+    joining = next((
+        reshaper for reshaper in reshapers if not reshaper._options[0]
+    ), reshapers[0])
+    others = [reshaper for reshaper in reshapers if reshaper is not joining]
+    joining_options = joining._options
+
+    joining_result = []
+    others_results = [[] for reshaper in others]
+    results = [joining_result] + others_results
+    position = 0
+    for start, end in runs:
+        if position < start:
+            for result in results:
+                result.append(text[position:start])
+        joined = joining._join_run(text[start:end], joining_options)
+        for reshaper, result in zip(others, others_results):
+            reshaper._write_run(
+                reshaper._rejoin_run(joined, joining),
+                reshaper._options, result
+            )
+        # Last, as writing a run changes its buffers
+        joining._write_run(joined, joining_options, joining_result)
+        position = end
+    if position < len(text):
+        for result in results:
+            result.append(text[position:])
+
+    reshaped = {
+        id(reshaper): ''.join(result)
+        for reshaper, result in zip([joining] + others, results)
+    }
+    return [reshaped[id(reshaper)] for reshaper in reshapers]
+
+
+def _worker_reshaper(arguments):
+    # The reshaper of a worker process for the `_worker_arguments` of a
+    # reshaper, kept for the next tasks
+    reshaper = _WORKER_RESHAPERS.get(arguments)
+    if reshaper is None:
+        configuration, font_glyphs, ligatures = arguments
+        reshaper = ArabicReshaper(dict(configuration),
+                                  font_glyphs=font_glyphs,
+                                  ligatures=ligatures)
+        _WORKER_RESHAPERS[arguments] = reshaper
+    return reshaper
+
+
+def _reshape_chunk(text, arguments):
+    # Runs in the worker processes of `reshape_parallel`
+    return _worker_reshaper(arguments).reshape(text)
 
 
 default_reshaper = ArabicReshaper()
 reshape = default_reshaper.reshape
+reshape_to = default_reshaper.reshape_to
+reshape_bytes = default_reshaper.reshape_bytes
+reshape_into = default_reshaper.reshape_into
+reshape_variants = default_reshaper.reshape_variants
+reshape_parallel = default_reshaper.reshape_parallel
+iter_reshape = default_reshaper.iter_reshape
+reshape_runs = default_reshaper.reshape_runs
+compile_template = default_reshaper.compile_template
+unreshape = default_reshaper.unreshape
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Reshaping of large batches of (usually short) strings.
+#
+# When NumPy is installed the whole batch is reshaped at once: the strings are
+# encoded into one UCS-4 array, the joining decisions are taken with array
+# lookups and shifted-array comparisons, the ligatures are found with a
+# single regular expression pass over the whole batch, and the presentation
+# forms and Harakat are gathered in bulk. Without NumPy every string goes
+# through `ArabicReshaper.reshape`, the results are the same either way.
+
+from importlib.util import find_spec
+
+from .letters import (UNSHAPED, ISOLATED, INITIAL, MEDIAL, FINAL, TATWEEL,
+                      ZWJ, connects_with_letter_before,
+                      connects_with_letter_after,
+                      connects_with_letters_before_and_after)
+
+# NumPy takes long to import, it is only imported when a batch is reshaped
+with_numpy = find_spec('numpy') is not None
+np = None
+
+NOT_SUPPORTED = -1
+
+# Codepoints above the Basic Multilingual Plane are looked up as U+FFFF, which
+# is a noncharacter, so it is neither a letter nor a haraka
+TABLE_SIZE = 0x10000
+
+# Separates the strings of the batch when looking for ligatures, it can't be
+# part of any ligature. The strings may have it too, the separators are
+# told apart by their positions
+SEPARATOR = '\x00'
+
+# The glyph of the missing forms and of the characters merged into a
+# ligature, like `REMOVED` in arabic_reshaper.py it isn't a codepoint
+REMOVED = 0xFFFFFFFF
+
+
+def reshape_batch(texts, reshaper=None):
+    """
+    Reshape every string in `texts` with `reshaper` (defaults to
+    `default_reshaper`) and return a list of the reshaped strings.
+    """
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+    texts = list(texts)
+    if not with_numpy:
+        return [reshaper.reshape(text) for text in texts]
+
+    global np
+    if np is None:
+        import numpy as np
+    return _NumpyBatchReshaper.for_reshaper(reshaper).reshape(texts)
+
+
+class _NumpyBatchReshaper(object):
+    """
+    Lookup tables derived from the letters and configuration of an
+    `ArabicReshaper`, and the vectorized reshaping that uses them.
+    """
+
+    @classmethod
+    def for_reshaper(cls, reshaper):
+        batch_reshaper = getattr(reshaper, '_batch_reshaper', None)
+        if batch_reshaper is None:
+            batch_reshaper = cls(reshaper)
+            reshaper._batch_reshaper = batch_reshaper
+        return batch_reshaper
+
+    def __init__(self, reshaper):
+        from .arabic_reshaper import HARAKAT_RE
+
+        self.reshaper = reshaper
+        configuration = reshaper.configuration
+        self.delete_harakat = configuration.getboolean('delete_harakat')
+        self.delete_tatweel = configuration.getboolean('delete_tatweel')
+        self.support_zwj = configuration.getboolean('support_zwj')
+        self.shift_harakat_position = configuration.getboolean(
+            'shift_harakat_position'
+        )
+        self.isolated_form = (
+            UNSHAPED
+            if configuration.getboolean('use_unshaped_instead_of_isolated')
+            else ISOLATED
+        )
+        self.support_ligatures = configuration.getboolean('support_ligatures')
+
+        bmp = ''.join(map(chr, range(TABLE_SIZE)))
+        self.is_haraka = np.zeros(TABLE_SIZE, dtype=bool)
+        self.is_haraka[[m.start() for m in HARAKAT_RE.finditer(bmp)]] = True
+
+        # Letter index 0 is used for everything that's not a letter
+        letters = reshaper.letters
+        self.letter_index = np.zeros(TABLE_SIZE, dtype=np.int32)
+        self.connects_before = np.zeros(len(letters) + 1, dtype=bool)
+        self.connects_after = np.zeros(len(letters) + 1, dtype=bool)
+        self.connects_both = np.zeros(len(letters) + 1, dtype=bool)
+        self.glyphs = np.zeros((len(letters) + 1, 4), dtype=np.uint32)
+        for i, (letter, forms) in enumerate(
+                reshaper._letter_forms.items(), 1):
+            self.letter_index[ord(letter)] = i
+            self.connects_before[i] = bool(
+                connects_with_letter_before(letter, letters))
+            self.connects_after[i] = bool(
+                connects_with_letter_after(letter, letters))
+            self.connects_both[i] = bool(
+                connects_with_letters_before_and_after(letter, letters))
+            self.glyphs[i] = [ord(form) if form else REMOVED
+                              for form in forms]
+
+        self.is_deleted = np.zeros(TABLE_SIZE, dtype=bool)
+        if self.delete_tatweel:
+            self.is_deleted[ord(TATWEEL)] = True
+        if not self.support_zwj:
+            self.is_deleted[ord(ZWJ)] = True
+
+        if self.support_ligatures:
+            self.ligatures_re = reshaper._ligatures_re
+            forms = reshaper._re_group_index_to_ligature_forms
+            self.support_ligatures = bool(forms)
+            self.ligature_glyphs = np.zeros((len(forms) + 1, 4),
+                                            dtype=np.uint32)
+            for group_index, ligature_forms in forms.items():
+                self.ligature_glyphs[group_index] = [
+                    ord(form) if form else REMOVED for form in ligature_forms
+                ]
+
+    def reshape(self, texts):
+        results = [''] * len(texts)
+
+        # The output positions of the original algorithm shift when a ZWJ
+        # is dropped, such strings are left to it
+        fallback = [i for i, text in enumerate(texts) if ZWJ in text]
+        for i in fallback:
+            results[i] = self.reshaper.reshape(texts[i])
+        if fallback:
+            fallback = set(fallback)
+            indices = [i for i in range(len(texts)) if i not in fallback]
+            texts = [texts[i] for i in indices]
+        else:
+            indices = range(len(texts))
+
+        for i, result in zip(indices, self._reshape(texts)):
+            results[i] = result
+        return results
+
+    def _reshape(self, texts):
+        if not texts:
+            return []
+
+        count = len(texts)
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=count)
+        codepoints = np.frombuffer(
+            ''.join(texts).encode('utf-32-le', 'surrogatepass'), dtype='<u4'
+        ).astype(np.int64)
+        string_ids = np.repeat(np.arange(count), lengths)
+        lookup = np.minimum(codepoints, TABLE_SIZE - 1)
+
+        # Classification of every character of the batch
+        is_haraka = self.is_haraka[lookup]
+        is_kept = ~is_haraka & ~self.is_deleted[lookup]
+
+        output = codepoints[is_kept]
+        output_string_ids = string_ids[is_kept]
+        output_lengths = np.bincount(output_string_ids, minlength=count)
+        output_starts = np.concatenate(([0], np.cumsum(output_lengths)[:-1]))
+        size = len(output)
+
+        letter_index = self.letter_index[
+            np.minimum(output, TABLE_SIZE - 1)
+        ]
+        is_letter = letter_index > 0
+        previous_index = np.concatenate(([0], letter_index[:-1]))
+        is_first = np.zeros(size, dtype=bool)
+        is_first[output_starts[output_lengths > 0]] = True
+
+        # joins[j] is True when the output character j connects to the one
+        # before it
+        can_join = (is_letter & ~is_first & (previous_index > 0) &
+                    self.connects_before[letter_index] &
+                    self.connects_after[previous_index])
+        # A letter that connects after but not on both sides can't connect
+        # to the next letter when it is connected to the one before it
+        breaks = ~self.connects_both[previous_index]
+        joins = can_join
+        while True:
+            previous_joins = np.concatenate(([False], joins[:-1]))
+            new_joins = can_join & ~(previous_joins & breaks)
+            if np.array_equal(new_joins, joins):
+                break
+            joins = new_joins
+        next_joins = np.concatenate((joins[1:], [False]))
+
+        forms = np.full(size, self.isolated_form, dtype=np.int16)
+        forms[joins & next_joins] = MEDIAL
+        forms[~joins & next_joins] = INITIAL
+        forms[joins & ~next_joins] = FINAL
+        forms[~is_letter] = NOT_SUPPORTED
+
+        is_shaped = is_letter & (forms != UNSHAPED)
+        glyphs = output.copy()
+        glyphs[is_shaped] = self.glyphs[letter_index[is_shaped],
+                                        forms[is_shaped]]
+
+        if self.support_ligatures and size:
+            self._apply_ligatures(output, output_string_ids, forms, glyphs)
+
+        if self.delete_harakat or not is_haraka.any():
+            codes = glyphs
+            code_string_ids = output_string_ids
+        else:
+            codes, code_string_ids = self._insert_harakat(
+                codepoints, string_ids, lengths, is_haraka, is_kept,
+                output_starts, glyphs, output_string_ids
+            )
+
+        is_emitted = codes != REMOVED
+        codes = codes[is_emitted]
+        result_lengths = np.bincount(code_string_ids[is_emitted],
+                                     minlength=count)
+        result = codes.astype('<u4').tobytes().decode('utf-32-le',
+                                                      'surrogatepass')
+        ends = np.cumsum(result_lengths).tolist()
+        starts = [0] + ends[:-1]
+        return [result[a:b] for a, b in zip(starts, ends)]
+
+    def _apply_ligatures(self, output, output_string_ids, forms, glyphs):
+        # Without Harakat and deleted characters, the output is exactly the
+        # text the ligatures are searched in
+        boundaries = np.flatnonzero(np.diff(output_string_ids)) + 1
+        separated = np.insert(output, boundaries, ord(SEPARATOR))
+        cleaned = separated.astype('<u4').tobytes().decode('utf-32-le',
+                                                           'surrogatepass')
+        matches = [
+            (match.start(), match.end(), match.lastindex - 1)
+            for match in self.ligatures_re.finditer(cleaned)
+        ]
+        if not matches:
+            return
+
+        spans = np.array(matches, dtype=np.int64)
+        # Every separator before a match moves it by one character
+        separators = boundaries + np.arange(len(boundaries))
+        shift = np.searchsorted(separators, spans[:, 0])
+        a = spans[:, 0] - shift
+        b = spans[:, 1] - shift
+
+        a_form = forms[a]
+        b_form = forms[b - 1]
+        isolated_form = self.isolated_form
+        starts_word = (a_form == isolated_form) | (a_form == INITIAL)
+        ends_word = (b_form == isolated_form) | (b_form == FINAL)
+        ligature_forms = np.where(
+            starts_word,
+            np.where(ends_word, ISOLATED, INITIAL),
+            np.where(ends_word, FINAL, MEDIAL)
+        )
+        ligature_glyphs = self.ligature_glyphs[spans[:, 2], ligature_forms]
+        applied = ligature_glyphs != REMOVED
+        a, b = a[applied], b[applied]
+
+        glyphs[a] = ligature_glyphs[applied]
+        forms[a] = NOT_SUPPORTED
+        removed = np.zeros(len(glyphs) + 1, dtype=np.int64)
+        np.add.at(removed, a + 1, 1)
+        np.add.at(removed, b, -1)
+        glyphs[np.cumsum(removed)[:-1] > 0] = REMOVED
+
+    def _insert_harakat(self, codepoints, string_ids, lengths, is_haraka,
+                        is_kept, output_starts, glyphs, output_string_ids):
+        # Each haraka goes after the output character that was last when it
+        # was read (the one before it if shifted), -1 puts it first
+        kept_before = np.cumsum(is_kept) - is_kept
+        haraka_indices = np.flatnonzero(is_haraka)
+        haraka_string_ids = string_ids[haraka_indices]
+        positions = (kept_before[haraka_indices] -
+                     output_starts[haraka_string_ids] - 1)
+        order = haraka_indices
+        if self.shift_harakat_position:
+            positions = positions - 1
+            order = -order
+        valid = positions >= -1
+
+        size = len(glyphs)
+        output_positions = (np.arange(size) -
+                            output_starts[output_string_ids])
+        codes = np.concatenate((glyphs,
+                                codepoints[haraka_indices][valid]))
+        code_string_ids = np.concatenate((output_string_ids,
+                                          haraka_string_ids[valid]))
+        permutation = np.lexsort((
+            np.concatenate((np.zeros(size, dtype=np.int64), order[valid])),
+            np.concatenate((np.zeros(size, dtype=np.int8),
+                            np.ones(valid.sum(), dtype=np.int8))),
+            np.concatenate((output_positions, positions[valid])),
+            code_string_ids,
+        ))
+        return codes[permutation], code_string_ids[permutation]
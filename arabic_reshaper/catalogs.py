@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Precompiling gettext catalogs into shaped catalogs, so the translated
+# strings don't have to be reshaped at runtime.
+#
+# A catalog is read from a .po file, the way `msgfmt` compiles it (fuzzy and
+# untranslated messages are left out), or from a compiled .mo file, and every
+# translation, with all its plural forms, is reshaped around its placeholders
+# and written to a .mo file encoded in UTF-8. The letters next to a
+# placeholder are shaped as if the placeholder wasn't a letter, the way they
+# would be reshaped at runtime with a value that isn't Arabic.
+
+import re
+import struct
+
+MO_MAGIC = 0x950412de
+
+CONTEXT_SEPARATOR = '\x04'
+
+CHARSET_RE = re.compile(r'charset=([^\s;"\\]+)', re.I)
+
+# printf style placeholders (`%s`, `%(name)s`, `%1$d`, `%%`) and
+# `str.format` ones (`{name}`, `{0:>5}`, `{{`, `}}`)
+PLACEHOLDERS_RE = re.compile(r'''(
+    %(?:\d+\$|\([^()\n]*\))?[-#0 +']*(?:\d+|\*)?(?:\.(?:\d+|\*))?
+    (?:hh|ll|[hlLqjzt])?[diouxXeEfFgGcrsa%]
+    |\{\{|\}\}|\{[^{}\n]*\}
+)''', re.X)
+
+
+def reshape_catalog(input, output, reshaper=None):
+    """
+    Reshape the translations of the gettext catalog `input`, a .po or .mo
+    file, and write them to the .mo file `output`, both binary file objects.
+    Returns the number of translated messages.
+
+    The placeholders of the translations, like `%s`, `%(name)s` or
+    `{name}`, are left as they are. `reshaper` defaults to
+    `default_reshaper`.
+    """
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+
+    data = input.read()
+    if data[:4] in (struct.pack('<I', MO_MAGIC),
+                    struct.pack('>I', MO_MAGIC)):
+        messages = _read_mo(data)
+    else:
+        messages = _read_po(data)
+
+    reshaped = {}
+
+    def reshape(text):
+        result = reshaped.get(text)
+        if result is None:
+            result = reshaped[text] = _reshape_message(text, reshaper)
+        return result
+
+    catalog = {}
+    for context, msgid, msgid_plural, msgstrs in messages:
+        if not any(msgstrs):
+            continue
+        key = msgid
+        if msgid_plural is not None:
+            key += '\0' + msgid_plural
+        if context is not None:
+            key = context + CONTEXT_SEPARATOR + key
+        if key:
+            msgstrs = [reshape(msgstr) for msgstr in msgstrs]
+        else:
+            # The header, the catalog is written in UTF-8
+            msgstrs = [CHARSET_RE.sub('charset=UTF-8', msgstrs[0])]
+        catalog[key] = '\0'.join(msgstrs)
+
+    _write_mo(catalog, output)
+    return len(catalog) - ('' in catalog)
+
+
+def _reshape_message(text, reshaper):
+    parts = PLACEHOLDERS_RE.split(text)
+    parts[::2] = [reshaper.reshape(part) for part in parts[::2]]
+    return ''.join(parts)
+
+
+def _charset(header):
+    match = CHARSET_RE.search(header)
+    charset = match.group(1) if match else 'utf-8'
+    return 'utf-8' if charset.upper() == 'CHARSET' else charset
+
+
+def _read_mo(data):
+    # The `(context, msgid, msgid_plural, msgstrs)` messages of a .mo file
+    byte_order = '<' if data[:4] == struct.pack('<I', MO_MAGIC) else '>'
+    count, ids_offset, strs_offset = struct.unpack_from(
+        byte_order + '3I', data, 8
+    )
+    entries = []
+    for i in range(count):
+        length, offset = struct.unpack_from(byte_order + '2I', data,
+                                            ids_offset + i * 8)
+        key = data[offset:offset + length]
+        length, offset = struct.unpack_from(byte_order + '2I', data,
+                                            strs_offset + i * 8)
+        entries.append((key, data[offset:offset + length]))
+
+    charset = 'utf-8'
+    for key, value in entries:
+        if not key:
+            charset = _charset(value.decode('ascii', 'replace'))
+
+    messages = []
+    for key, value in entries:
+        key = key.decode(charset)
+        context = None
+        if CONTEXT_SEPARATOR in key:
+            context, key = key.split(CONTEXT_SEPARATOR, 1)
+        msgid_plural = None
+        if '\0' in key:
+            key, msgid_plural = key.split('\0', 1)
+        messages.append((context, key, msgid_plural,
+                         value.decode(charset).split('\0')))
+    return messages
+
+
+def _read_po(data):
+    # The `(context, msgid, msgid_plural, msgstrs)` messages of a .po file,
+    # parsed the way Python's msgfmt.py does
+    import ast
+
+    charset = 'utf-8'
+    header = re.search(br'^msgid ""\s*\nmsgstr ((?:"[^\n]*"\s*\n?)+)', data,
+                       re.M)
+    if header:
+        charset = _charset(header.group(1).decode('ascii', 'replace'))
+
+    messages = []
+    entry = None
+    fuzzy = False
+    section = None
+    for number, line in enumerate(data.decode(charset).splitlines(), 1):
+        line = line.strip()
+        if line.startswith('#'):
+            if section == 'msgstr':
+                _add_po_message(messages, entry, fuzzy)
+                entry = None
+                fuzzy = False
+                section = None
+            if line.startswith('#,') and 'fuzzy' in line:
+                fuzzy = True
+            continue
+        if not line:
+            continue
+
+        keyword, _, string = line.partition(' ')
+        if keyword == 'msgctxt' or (keyword == 'msgid' and
+                                    section != 'msgctxt'):
+            if section == 'msgstr':
+                _add_po_message(messages, entry, fuzzy)
+                entry = None
+                fuzzy = False
+            if entry is None:
+                entry = [None, '', None, {}]
+            section = keyword
+            target = 0 if keyword == 'msgctxt' else 1
+            entry[target] = ''
+        elif keyword == 'msgid':
+            section = keyword
+            target = 1
+            entry[target] = ''
+        elif keyword == 'msgid_plural':
+            section = keyword
+            target = 2
+            entry[target] = ''
+        elif keyword.startswith('msgstr'):
+            if entry is None:
+                raise ValueError('msgstr without msgid on line {}'.format(
+                    number
+                ))
+            section = 'msgstr'
+            index = keyword[7:-1] if keyword.startswith('msgstr[') else '0'
+            target = int(index)
+            entry[3][target] = ''
+        else:
+            string = line
+        if section is None:
+            raise ValueError('Syntax error on line {}'.format(number))
+
+        try:
+            string = ast.literal_eval(string)
+        except (SyntaxError, ValueError):
+            raise ValueError('Syntax error on line {}'.format(number))
+        if section == 'msgstr':
+            entry[3][target] += string
+        else:
+            entry[target] += string
+    if section == 'msgstr':
+        _add_po_message(messages, entry, fuzzy)
+    return messages
+
+
+def _add_po_message(messages, entry, fuzzy):
+    context, msgid, msgid_plural, msgstrs = entry
+    # Like msgfmt, fuzzy messages are left out, except the header
+    if not fuzzy or not msgid:
+        messages.append((context, msgid, msgid_plural,
+                         [msgstrs[i] for i in sorted(msgstrs)]))
+
+
+def _write_mo(catalog, output):
+    # Write the `catalog`, a dict of keys to translations, as a .mo file, the
+    # way Python's msgfmt.py does
+    keys = sorted(catalog, key=lambda key: key.encode('utf-8'))
+    ids = strs = b''
+    offsets = []
+    for key in keys:
+        msgid = key.encode('utf-8')
+        msgstr = catalog[key].encode('utf-8')
+        offsets.append((len(ids), len(msgid), len(strs), len(msgstr)))
+        ids += msgid + b'\0'
+        strs += msgstr + b'\0'
+
+    # The tables of (length, offset) pairs come after the 7 words of the
+    # header, followed by the msgids and the msgstrs
+    ids_start = 7 * 4 + 16 * len(keys)
+    strs_start = ids_start + len(ids)
+    key_offsets = []
+    value_offsets = []
+    for id_offset, id_length, str_offset, str_length in offsets:
+        key_offsets += [id_length, id_offset + ids_start]
+        value_offsets += [str_length, str_offset + strs_start]
+    output.write(struct.pack('<7I', MO_MAGIC, 0, len(keys), 7 * 4,
+                             7 * 4 + len(keys) * 8, 0, 0))
+    output.write(struct.pack('<{}I'.format(len(key_offsets)), *key_offsets))
+    output.write(struct.pack('<{}I'.format(len(value_offsets)),
+                             *value_offsets))
+    output.write(ids)
+    output.write(strs)
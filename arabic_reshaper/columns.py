@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Reshaping of pandas Series and Arrow string columns.
+#
+# Columns usually repeat a small number of values (city names, categories,
+# ...), so each distinct value is reshaped only once, through the categorical
+# codes or dictionary encoding of the column, and the results are broadcast
+# back to all the rows.
+
+from importlib.util import find_spec
+
+from .batch import reshape_batch
+
+# pandas and pyarrow take long to import, they are only imported when used
+with_pandas = find_spec('pandas') is not None
+with_pyarrow = find_spec('pyarrow') is not None
+
+
+def reshape_series(series, reshaper=None):
+    """
+    Reshape a pandas Series of strings with `reshaper` (defaults to
+    `default_reshaper`), nulls are kept as nulls.
+
+    The result is backed by an Arrow string array when pyarrow is installed,
+    otherwise it is a Series of Python strings.
+    """
+    if not with_pandas:
+        raise Exception('pandas not installed, ' +
+                        'install it then rerun this.\n' +
+                        '$ pip install pandas')
+    import pandas as pd
+
+    codes, uniques = pd.factorize(series)
+    reshaped = reshape_batch(list(uniques), reshaper)
+
+    if with_pyarrow:
+        import pyarrow as pa
+        values = pa.array(reshaped, type=pa.string()).take(
+            pa.array(codes, mask=codes < 0)
+        )
+        values = pd.arrays.ArrowExtensionArray(values)
+    else:
+        # Code -1 is for nulls and picks the None at the end
+        values = pd.Series(reshaped + [None], dtype=object).values[codes]
+
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def reshape_arrow(array, reshaper=None):
+    """
+    Reshape an Arrow array (or chunked array) of strings with `reshaper`
+    (defaults to `default_reshaper`), nulls are kept as nulls.
+
+    Dictionary encoded arrays are reshaped without decoding them, the result
+    is always a plain array of the dictionary's value type.
+    """
+    if not with_pyarrow:
+        raise Exception('pyarrow not installed, ' +
+                        'install it then rerun this.\n' +
+                        '$ pip install pyarrow')
+    import pyarrow as pa
+
+    if isinstance(array, pa.ChunkedArray):
+        if not pa.types.is_dictionary(array.type):
+            array = array.dictionary_encode()
+        array = array.unify_dictionaries()
+        if not array.num_chunks:
+            return pa.chunked_array([], type=array.type.value_type)
+        dictionary = _reshape_dictionary(array.chunk(0).dictionary, reshaper)
+        return pa.chunked_array(
+            [dictionary.take(chunk.indices) for chunk in array.chunks],
+            type=dictionary.type
+        )
+
+    if not pa.types.is_dictionary(array.type):
+        array = array.dictionary_encode()
+    dictionary = _reshape_dictionary(array.dictionary, reshaper)
+    return dictionary.take(array.indices)
+
+
+def _reshape_dictionary(dictionary, reshaper):
+    import pyarrow as pa
+    values = dictionary.to_pylist()
+    reshaped = reshape_batch([value or '' for value in values], reshaper)
+    if dictionary.null_count:
+        reshaped = [
+            None if value is None else shaped
+            for value, shaped in zip(values, reshaped)
+        ]
+    return pa.array(reshaped, type=dictionary.type)
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# This file is generated by tools/generate_joining_data.py from the Unicode
+# Character Database, don't edit it, rerun the generator instead.
+#
+# JOINING_TYPES and PRESENTATION_FORMS are tuples of (first codepoint, table)
+# where the table holds the data of consecutive codepoints: one joining type
+# per codepoint, D (dual joining), R (right joining), L (left joining),
+# C (join causing), T (transparent) or U (non joining), and four presentation
+# forms per codepoint, isolated, initial, medial and final, '\x00' when
+# Unicode has no presentation form.
+
+UNICODE_VERSION = '14.0.0'
+
+JOINING_TYPES = (
+    (0x0600, (
+        'UUUUUUUUUUUUUUUUTTTTTTTTTTTUTUUU'  # U+0600..U+061F
+        'DURRRRDRDRDDDDDRRRRDDDDDDDDDDDDD'  # U+0620..U+063F
+        'CDDDDDDDRDDTTTTTTTTTTTTTTTTTTTTT'  # U+0640..U+065F
+        'UUUUUUUUUUUUUUDDTRRRURRRDDDDDDDD'  # U+0660..U+067F
+        'DDDDDDDDRRRRRRRRRRRRRRRRRRDDDDDD'  # U+0680..U+069F
+        'DDDDDDDDDDDDDDDDDDDDDDDDDDDDDDDD'  # U+06A0..U+06BF
+        'RDDRRRRRRRRRDRDRDDRRURTTTTTTTUUT'  # U+06C0..U+06DF
+        'TTTTTUUTTUTTTTRRUUUUUUUUUUDDDUUD'  # U+06E0..U+06FF
+    )),
+    (0x0750, (
+        'DDDDDDDDDRRRDDDDDDDDDDDDDDDRRDDD'  # U+0750..U+076F
+        'DRDRRDDDRRDDDDDD'  # U+0770..U+077F
+    )),
+    (0x0870, (
+        'RRRRRRRRRRRRRRRRRRRCCCDUUDDDDDRU'  # U+0870..U+088F
+        'UUUUUUUUTTTTTTTTDDDDDDDDDDRRRURD'  # U+0890..U+08AF
+        'DRRDDDDDDRDDDDDDDDDDDDDDDUTTTTTT'  # U+08B0..U+08CF
+        'TTTTTTTTTTTTTTTTTTUTTTTTTTTTTTTT'  # U+08D0..U+08EF
+        'TTTTTTTTTTTTTTTT'  # U+08F0..U+08FF
+    )),
+    (0x200D, (
+        'C'  # U+200D..U+200D
+    )),
+)
+
+PRESENTATION_FORMS = (
+    (0x0621, (
+        '\uFE80\x00\x00\x00'  # ARABIC LETTER HAMZA
+        '\uFE81\x00\x00\uFE82'  # ARABIC LETTER ALEF WITH MADDA ABOVE
+        '\uFE83\x00\x00\uFE84'  # ARABIC LETTER ALEF WITH HAMZA ABOVE
+        '\uFE85\x00\x00\uFE86'  # ARABIC LETTER WAW WITH HAMZA ABOVE
+        '\uFE87\x00\x00\uFE88'  # ARABIC LETTER ALEF WITH HAMZA BELOW
+        '\uFE89\uFE8B\uFE8C\uFE8A'  # ARABIC LETTER YEH WITH HAMZA ABOVE
+        '\uFE8D\x00\x00\uFE8E'  # ARABIC LETTER ALEF
+        '\uFE8F\uFE91\uFE92\uFE90'  # ARABIC LETTER BEH
+        '\uFE93\x00\x00\uFE94'  # ARABIC LETTER TEH MARBUTA
+        '\uFE95\uFE97\uFE98\uFE96'  # ARABIC LETTER TEH
+        '\uFE99\uFE9B\uFE9C\uFE9A'  # ARABIC LETTER THEH
+        '\uFE9D\uFE9F\uFEA0\uFE9E'  # ARABIC LETTER JEEM
+        '\uFEA1\uFEA3\uFEA4\uFEA2'  # ARABIC LETTER HAH
+        '\uFEA5\uFEA7\uFEA8\uFEA6'  # ARABIC LETTER KHAH
+        '\uFEA9\x00\x00\uFEAA'  # ARABIC LETTER DAL
+        '\uFEAB\x00\x00\uFEAC'  # ARABIC LETTER THAL
+        '\uFEAD\x00\x00\uFEAE'  # ARABIC LETTER REH
+        '\uFEAF\x00\x00\uFEB0'  # ARABIC LETTER ZAIN
+        '\uFEB1\uFEB3\uFEB4\uFEB2'  # ARABIC LETTER SEEN
+        '\uFEB5\uFEB7\uFEB8\uFEB6'  # ARABIC LETTER SHEEN
+        '\uFEB9\uFEBB\uFEBC\uFEBA'  # ARABIC LETTER SAD
+        '\uFEBD\uFEBF\uFEC0\uFEBE'  # ARABIC LETTER DAD
+        '\uFEC1\uFEC3\uFEC4\uFEC2'  # ARABIC LETTER TAH
+        '\uFEC5\uFEC7\uFEC8\uFEC6'  # ARABIC LETTER ZAH
+        '\uFEC9\uFECB\uFECC\uFECA'  # ARABIC LETTER AIN
+        '\uFECD\uFECF\uFED0\uFECE'  # ARABIC LETTER GHAIN
+        '\x00\x00\x00\x00'  # ARABIC LETTER KEHEH WITH TWO DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER KEHEH WITH THREE DOTS BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER FARSI YEH WITH INVERTED V
+        '\x00\x00\x00\x00'  # ARABIC LETTER FARSI YEH WITH TWO DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC TATWEEL
+        '\uFED1\uFED3\uFED4\uFED2'  # ARABIC LETTER FEH
+        '\uFED5\uFED7\uFED8\uFED6'  # ARABIC LETTER QAF
+        '\uFED9\uFEDB\uFEDC\uFEDA'  # ARABIC LETTER KAF
+        '\uFEDD\uFEDF\uFEE0\uFEDE'  # ARABIC LETTER LAM
+        '\uFEE1\uFEE3\uFEE4\uFEE2'  # ARABIC LETTER MEEM
+        '\uFEE5\uFEE7\uFEE8\uFEE6'  # ARABIC LETTER NOON
+        '\uFEE9\uFEEB\uFEEC\uFEEA'  # ARABIC LETTER HEH
+        '\uFEED\x00\x00\uFEEE'  # ARABIC LETTER WAW
+        '\uFEEF\uFBE8\uFBE9\uFEF0'  # ARABIC LETTER ALEF MAKSURA
+        '\uFEF1\uFEF3\uFEF4\uFEF2'  # ARABIC LETTER YEH
+        '\x00\x00\x00\x00'  # ARABIC FATHATAN
+        '\x00\x00\x00\x00'  # ARABIC DAMMATAN
+        '\x00\x00\x00\x00'  # ARABIC KASRATAN
+        '\x00\x00\x00\x00'  # ARABIC FATHA
+        '\x00\x00\x00\x00'  # ARABIC DAMMA
+        '\x00\x00\x00\x00'  # ARABIC KASRA
+        '\x00\x00\x00\x00'  # ARABIC SHADDA
+        '\x00\x00\x00\x00'  # ARABIC SUKUN
+        '\x00\x00\x00\x00'  # ARABIC MADDAH ABOVE
+        '\x00\x00\x00\x00'  # ARABIC HAMZA ABOVE
+        '\x00\x00\x00\x00'  # ARABIC HAMZA BELOW
+        '\x00\x00\x00\x00'  # ARABIC SUBSCRIPT ALEF
+        '\x00\x00\x00\x00'  # ARABIC INVERTED DAMMA
+        '\x00\x00\x00\x00'  # ARABIC MARK NOON GHUNNA
+        '\x00\x00\x00\x00'  # ARABIC ZWARAKAY
+        '\x00\x00\x00\x00'  # ARABIC VOWEL SIGN SMALL V ABOVE
+        '\x00\x00\x00\x00'  # ARABIC VOWEL SIGN INVERTED SMALL V ABOVE
+        '\x00\x00\x00\x00'  # ARABIC VOWEL SIGN DOT BELOW
+        '\x00\x00\x00\x00'  # ARABIC REVERSED DAMMA
+        '\x00\x00\x00\x00'  # ARABIC FATHA WITH TWO DOTS
+        '\x00\x00\x00\x00'  # ARABIC WAVY HAMZA BELOW
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT ZERO
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT ONE
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT TWO
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT THREE
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT FOUR
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT FIVE
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT SIX
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT SEVEN
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT EIGHT
+        '\x00\x00\x00\x00'  # ARABIC-INDIC DIGIT NINE
+        '\x00\x00\x00\x00'  # ARABIC PERCENT SIGN
+        '\x00\x00\x00\x00'  # ARABIC DECIMAL SEPARATOR
+        '\x00\x00\x00\x00'  # ARABIC THOUSANDS SEPARATOR
+        '\x00\x00\x00\x00'  # ARABIC FIVE POINTED STAR
+        '\x00\x00\x00\x00'  # ARABIC LETTER DOTLESS BEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER DOTLESS QAF
+        '\x00\x00\x00\x00'  # ARABIC LETTER SUPERSCRIPT ALEF
+        '\uFB50\x00\x00\uFB51'  # ARABIC LETTER ALEF WASLA
+        '\x00\x00\x00\x00'  # ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER ALEF WITH WAVY HAMZA BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER HIGH HAMZA
+        '\x00\x00\x00\x00'  # ARABIC LETTER HIGH HAMZA ALEF
+        '\x00\x00\x00\x00'  # ARABIC LETTER HIGH HAMZA WAW
+        '\uFBDD\x00\x00\x00'  # ARABIC LETTER U WITH HAMZA ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER HIGH HAMZA YEH
+        '\uFB66\uFB68\uFB69\uFB67'  # ARABIC LETTER TTEH
+        '\uFB5E\uFB60\uFB61\uFB5F'  # ARABIC LETTER TTEHEH
+        '\uFB52\uFB54\uFB55\uFB53'  # ARABIC LETTER BEEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER TEH WITH RING
+        '\x00\x00\x00\x00'  # ARABIC LETTER TEH WITH THREE DOTS ABOVE DOWNWARDS
+        '\uFB56\uFB58\uFB59\uFB57'  # ARABIC LETTER PEH
+        '\uFB62\uFB64\uFB65\uFB63'  # ARABIC LETTER TEHEH
+        '\uFB5A\uFB5C\uFB5D\uFB5B'  # ARABIC LETTER BEHEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER HAH WITH HAMZA ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER HAH WITH TWO DOTS VERTICAL ABOVE
+        '\uFB76\uFB78\uFB79\uFB77'  # ARABIC LETTER NYEH
+        '\uFB72\uFB74\uFB75\uFB73'  # ARABIC LETTER DYEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER HAH WITH THREE DOTS ABOVE
+        '\uFB7A\uFB7C\uFB7D\uFB7B'  # ARABIC LETTER TCHEH
+        '\uFB7E\uFB80\uFB81\uFB7F'  # ARABIC LETTER TCHEHEH
+        '\uFB88\x00\x00\uFB89'  # ARABIC LETTER DDAL
+        '\x00\x00\x00\x00'  # ARABIC LETTER DAL WITH RING
+        '\x00\x00\x00\x00'  # ARABIC LETTER DAL WITH DOT BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER DAL WITH DOT BELOW AND SMALL TAH
+        '\uFB84\x00\x00\uFB85'  # ARABIC LETTER DAHAL
+        '\uFB82\x00\x00\uFB83'  # ARABIC LETTER DDAHAL
+        '\uFB86\x00\x00\uFB87'  # ARABIC LETTER DUL
+        '\x00\x00\x00\x00'  # ARABIC LETTER DAL WITH THREE DOTS ABOVE DOWNWARDS
+        '\x00\x00\x00\x00'  # ARABIC LETTER DAL WITH FOUR DOTS ABOVE
+        '\uFB8C\x00\x00\uFB8D'  # ARABIC LETTER RREH
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH SMALL V
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH RING
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH DOT BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH SMALL V BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH DOT BELOW AND DOT ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH TWO DOTS ABOVE
+        '\uFB8A\x00\x00\uFB8B'  # ARABIC LETTER JEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER REH WITH FOUR DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER SEEN WITH DOT BELOW AND DOT ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER SEEN WITH THREE DOTS BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER SEEN WITH THREE DOTS BELOW AND THRE
+        '\x00\x00\x00\x00'  # ARABIC LETTER SAD WITH TWO DOTS BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER SAD WITH THREE DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER TAH WITH THREE DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER AIN WITH THREE DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER DOTLESS FEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER FEH WITH DOT MOVED BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER FEH WITH DOT BELOW
+        '\uFB6A\uFB6C\uFB6D\uFB6B'  # ARABIC LETTER VEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER FEH WITH THREE DOTS BELOW
+        '\uFB6E\uFB70\uFB71\uFB6F'  # ARABIC LETTER PEHEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER QAF WITH DOT ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER QAF WITH THREE DOTS ABOVE
+        '\uFB8E\uFB90\uFB91\uFB8F'  # ARABIC LETTER KEHEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER SWASH KAF
+        '\x00\x00\x00\x00'  # ARABIC LETTER KAF WITH RING
+        '\x00\x00\x00\x00'  # ARABIC LETTER KAF WITH DOT ABOVE
+        '\uFBD3\uFBD5\uFBD6\uFBD4'  # ARABIC LETTER NG
+        '\x00\x00\x00\x00'  # ARABIC LETTER KAF WITH THREE DOTS BELOW
+        '\uFB92\uFB94\uFB95\uFB93'  # ARABIC LETTER GAF
+        '\x00\x00\x00\x00'  # ARABIC LETTER GAF WITH RING
+        '\uFB9A\uFB9C\uFB9D\uFB9B'  # ARABIC LETTER NGOEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER GAF WITH TWO DOTS BELOW
+        '\uFB96\uFB98\uFB99\uFB97'  # ARABIC LETTER GUEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER GAF WITH THREE DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER LAM WITH SMALL V
+        '\x00\x00\x00\x00'  # ARABIC LETTER LAM WITH DOT ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER LAM WITH THREE DOTS ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER LAM WITH THREE DOTS BELOW
+        '\x00\x00\x00\x00'  # ARABIC LETTER NOON WITH DOT BELOW
+        '\uFB9E\x00\x00\uFB9F'  # ARABIC LETTER NOON GHUNNA
+        '\uFBA0\uFBA2\uFBA3\uFBA1'  # ARABIC LETTER RNOON
+        '\x00\x00\x00\x00'  # ARABIC LETTER NOON WITH RING
+        '\x00\x00\x00\x00'  # ARABIC LETTER NOON WITH THREE DOTS ABOVE
+        '\uFBAA\uFBAC\uFBAD\uFBAB'  # ARABIC LETTER HEH DOACHASHMEE
+        '\x00\x00\x00\x00'  # ARABIC LETTER TCHEH WITH DOT ABOVE
+        '\uFBA4\x00\x00\uFBA5'  # ARABIC LETTER HEH WITH YEH ABOVE
+        '\uFBA6\uFBA8\uFBA9\uFBA7'  # ARABIC LETTER HEH GOAL
+        '\x00\x00\x00\x00'  # ARABIC LETTER HEH GOAL WITH HAMZA ABOVE
+        '\x00\x00\x00\x00'  # ARABIC LETTER TEH MARBUTA GOAL
+        '\x00\x00\x00\x00'  # ARABIC LETTER WAW WITH RING
+        '\uFBE0\x00\x00\uFBE1'  # ARABIC LETTER KIRGHIZ OE
+        '\uFBD9\x00\x00\uFBDA'  # ARABIC LETTER OE
+        '\uFBD7\x00\x00\uFBD8'  # ARABIC LETTER U
+        '\uFBDB\x00\x00\uFBDC'  # ARABIC LETTER YU
+        '\uFBE2\x00\x00\uFBE3'  # ARABIC LETTER KIRGHIZ YU
+        '\x00\x00\x00\x00'  # ARABIC LETTER WAW WITH TWO DOTS ABOVE
+        '\uFBDE\x00\x00\uFBDF'  # ARABIC LETTER VE
+        '\uFBFC\uFBFE\uFBFF\uFBFD'  # ARABIC LETTER FARSI YEH
+        '\x00\x00\x00\x00'  # ARABIC LETTER YEH WITH TAIL
+        '\x00\x00\x00\x00'  # ARABIC LETTER YEH WITH SMALL V
+        '\x00\x00\x00\x00'  # ARABIC LETTER WAW WITH DOT ABOVE
+        '\uFBE4\uFBE6\uFBE7\uFBE5'  # ARABIC LETTER E
+        '\x00\x00\x00\x00'  # ARABIC LETTER YEH WITH THREE DOTS BELOW
+        '\uFBAE\x00\x00\uFBAF'  # ARABIC LETTER YEH BARREE
+        '\uFBB0\x00\x00\uFBB1'  # ARABIC LETTER YEH BARREE WITH HAMZA ABOVE
+    )),
+)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Lexicons of the most frequent words of a corpus with their shapes, saved to
+# a file so a new process takes them from it instead of reshaping them.
+#
+# A lexicon is a UTF-8 text file, its first line has the format version and
+# the digest of the configuration it was built with, then each line has a
+# word and its shape separated by a tab.
+
+import io
+from collections import Counter
+
+MAGIC = 'arabic-reshaper-lexicon'
+VERSION = '1'
+
+
+def build_lexicon(texts, path, reshaper=None, size=10000):
+    """
+    Count the words of `texts` as `reshaper` (defaults to `default_reshaper`)
+    reshapes them, and write the `size` most frequent ones with their shapes
+    to the lexicon file `path`, to be loaded with `load_lexicon` or the
+    `lexicon` argument of an `ArabicReshaper` with the same configuration.
+    """
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+
+    counts = Counter()
+    runs_re = reshaper._arabic_runs_re
+    for text in texts:
+        for match in runs_re.finditer(text):
+            words = reshaper._run_words(match.group())
+            if words is not None:
+                counts.update(words[::2])
+
+    options = reshaper._options
+    lexicon = {}
+    for word, _ in counts.most_common():
+        if len(lexicon) == size:
+            break
+        # Words that don't take part in reshaping, and the ones that can't be
+        # written on a line, are left out
+        if not runs_re.search(word) or '\t' in word:
+            continue
+        result = []
+        reshaper._write_run(reshaper._join_run(word, options), options,
+                            result)
+        lexicon[word] = ''.join(result)
+
+    write_lexicon(path, reshaper._configuration_digest, lexicon)
+    return lexicon
+
+
+def write_lexicon(path, digest, lexicon):
+    with io.open(path, 'w', encoding='utf-8', errors='surrogatepass',
+                 newline='\n') as f:
+        f.write('{} {} {}\n'.format(MAGIC, VERSION, digest.hex()))
+        for word, shaped in lexicon.items():
+            f.write('{}\t{}\n'.format(word, shaped))
+
+
+def read_lexicon(path):
+    """
+    Return the configuration digest and the words of the lexicon at `path`.
+    """
+    with io.open(path, 'r', encoding='utf-8', errors='surrogatepass',
+                 newline='\n') as f:
+        header = f.readline().split()
+        if len(header) != 3 or header[0] != MAGIC or header[1] != VERSION:
+            raise ValueError('{} is not a lexicon'.format(path))
+        lexicon = dict(
+            line[:-1].split('\t', 1) for line in f if line.endswith('\n')
+        )
+    return bytes.fromhex(header[2]), lexicon
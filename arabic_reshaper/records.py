@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Streaming the records of CSV and JSON Lines files through the reshaper,
+# only reshaping the selected fields.
+#
+# The files are read and written as bytes, a record is copied as it was read
+# when it has no non-ASCII characters (or JSON escapes, which may hide some),
+# or when none of its selected fields change, so only the records with Arabic
+# in the selected fields are encoded again. Even then only the fields or
+# strings that changed are written again, the rest of the record is kept
+# byte for byte. The records can be reshaped in batches by worker processes,
+# the output keeps the order of the input.
+#
+# The csv and json modules are imported by the functions using them, the
+# package is imported by many who never reshape a file.
+
+import io
+import os
+import re
+from collections import deque
+
+# Records that may have characters the reshaper changes
+NON_ASCII_RE = re.compile(b'[\x80-\xff]')
+NON_ASCII_JSON_RE = re.compile(b'[\x80-\xff]|\\\\u')
+
+LINE_ENDING_RE = re.compile(b'\r?\n$|\r$')
+
+JSON_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+# The delimiter after a value or a key, with the whitespace around it
+JSON_DELIMITER_RE = re.compile(r'[ \t\n\r]*([,:\]}]?)[ \t\n\r]*')
+
+BATCH_SIZE = 1000
+
+
+def reshape_csv(input, output, columns, reshaper=None, header=None,
+                encoding='utf-8', workers=1, batch_size=BATCH_SIZE,
+                **fmtparams):
+    """
+    Reshape the `columns` of the CSV file `input` and write the result to
+    `output`, both binary file objects. Returns the number of rows.
+
+    `columns` are names of columns, taken from the header row, or indexes.
+    `header` tells whether the first row is a header, which is left as is,
+    it defaults to whether any column is given by its name. `fmtparams` are
+    passed to `csv.reader` and `csv.writer`.
+
+    The rows are reshaped by `reshaper` (defaults to `default_reshaper`), in
+    batches of `batch_size` rows spread over `workers` processes (`None` for
+    the number of CPUs).
+    """
+    reshaper = _reshaper(reshaper)
+    columns = list(columns)
+    if header is None:
+        header = any(not isinstance(column, int) for column in columns)
+
+    records = _csv_records(input, encoding, fmtparams)
+    indexes = columns
+    if header:
+        row, raw = next(records, (None, None))
+        if row is None:
+            return 0
+        output.write(raw)
+        indexes = [column if isinstance(column, int) else row.index(column)
+                   for column in columns]
+
+    count = 0
+    for batch in _map_batches(_reshape_csv_batch,
+                              _batches(records, batch_size),
+                              (indexes, encoding, fmtparams), reshaper,
+                              workers):
+        output.write(b''.join(batch))
+        count += len(batch)
+    return count
+
+
+def reshape_jsonl(input, output, paths, reshaper=None, workers=1,
+                  batch_size=BATCH_SIZE):
+    """
+    Reshape the strings at `paths` in the records of the JSON Lines file
+    `input` and write the result to `output`, both binary file objects.
+    Returns the number of lines.
+
+    A path is a string of keys separated by dots, like `'user.name'`, the
+    lists met along a path are gone through item by item, and a list of
+    strings at the end of a path has all its strings reshaped.
+
+    The records are reshaped by `reshaper` (defaults to `default_reshaper`),
+    in batches of `batch_size` lines spread over `workers` processes (`None`
+    for the number of CPUs).
+    """
+    reshaper = _reshaper(reshaper)
+    paths = _paths_tree([path.split('.') for path in paths])
+
+    count = 0
+    for batch in _map_batches(_reshape_jsonl_batch,
+                              _batches(input, batch_size), (paths,),
+                              reshaper, workers):
+        output.write(b''.join(batch))
+        count += len(batch)
+    return count
+
+
+def _reshaper(reshaper):
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+    return reshaper
+
+
+def _csv_records(input, encoding, fmtparams):
+    # The rows of the CSV file with the bytes they were read from, the
+    # reader takes the lines of a row as it needs them, rows may have line
+    # breaks in quoted fields
+    import csv
+
+    lines = []
+
+    def decoded_lines():
+        for line in input:
+            lines.append(line)
+            yield line.decode(encoding)
+
+    for row in csv.reader(decoded_lines(), **fmtparams):
+        yield row, b''.join(lines)
+        del lines[:]
+
+
+def _batches(records, batch_size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _map_batches(function, batches, arguments, reshaper, workers):
+    # Yield `function(batch, reshaper, *arguments)` for each of `batches` in
+    # order, computed by a pool of `workers` processes that get at most two
+    # batches each ahead of the output
+    if workers == 1:
+        for batch in batches:
+            yield function(batch, reshaper, *arguments)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    workers = workers or os.cpu_count() or 1
+    reshaper_arguments = reshaper._worker_arguments
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(function, batch,
+                                           reshaper_arguments, *arguments))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _worker_reshaper(reshaper):
+    # A reshaper, or the arguments to get the reshaper of a worker process
+    if isinstance(reshaper, tuple):
+        from .arabic_reshaper import _worker_reshaper
+        reshaper = _worker_reshaper(reshaper)
+    return reshaper
+
+
+def _batch_reshape(reshaper):
+    # The reshape function for a batch, fields often repeat the same values
+    # so they are reshaped once per batch
+    reshape = _worker_reshaper(reshaper).reshape
+    reshaped = {}
+
+    def batch_reshape(text):
+        result = reshaped.get(text)
+        if result is None:
+            result = reshaped[text] = reshape(text)
+        return result
+    return batch_reshape
+
+
+def _reshape_csv_batch(records, reshaper, indexes, encoding, fmtparams):
+    reshape = _batch_reshape(reshaper)
+    reshapes_ascii = _worker_reshaper(reshaper)._reshapes_ascii
+    fields = _CsvFields(fmtparams)
+    result = []
+    for row, raw in records:
+        changed = {}
+        if reshapes_ascii or NON_ASCII_RE.search(raw):
+            for i in indexes:
+                if i < len(row):
+                    reshaped = reshape(row[i])
+                    if reshaped != row[i]:
+                        changed[i] = reshaped
+        if not changed:
+            result.append(raw)
+            continue
+        # The fields that change are written in place of the ones read, with
+        # the quoting they had, the rest of the row is kept as it was
+        text = raw.decode(encoding)
+        spans = fields.spans(text)
+        if len(spans) != len(row):
+            # Not found as read, the whole row is written again with the
+            # line ending it was read with
+            for i, reshaped in changed.items():
+                row[i] = reshaped
+            ending = LINE_ENDING_RE.search(raw)
+            result.append(fields.row(
+                row, ending.group().decode('ascii') if ending else ''
+            ).encode(encoding))
+            continue
+        pieces = []
+        position = 0
+        for i in sorted(changed):
+            start, end, quoted = spans[i]
+            pieces.append(text[position:start])
+            pieces.append(fields.field(changed[i], quoted, len(row) == 1))
+            position = end
+        pieces.append(text[position:])
+        result.append(''.join(pieces).encode(encoding))
+    return result
+
+
+class _CsvFields(object):
+    # Finds the fields of the rows of a CSV file in the text they were read
+    # from, and writes fields and rows in the dialect of the file
+
+    def __init__(self, fmtparams):
+        import csv
+
+        dialect = csv.reader((), **fmtparams).dialect
+        self.dialect = dialect
+        self.fmtparams = fmtparams
+        self.buffer = io.StringIO()
+        self.writers = {}
+
+        # A field followed by a delimiter or the end of the row, the way
+        # `csv.reader` reads it: a quoted field goes on after the closing
+        # quote up to the delimiter
+        escape = ('|' + re.escape(dialect.escapechar) + r'[\s\S]'
+                  if dialect.escapechar else '')
+        unquoted = r'(?:[^{}{}\r\n]{})*'.format(
+            re.escape(dialect.delimiter),
+            re.escape(dialect.escapechar or ''), escape
+        )
+        field = unquoted
+        if dialect.quoting != csv.QUOTE_NONE and dialect.quotechar:
+            quote = re.escape(dialect.quotechar)
+            quoted = '{0}(?:[^{0}{1}]{2}{3})*{0}'.format(
+                quote, re.escape(dialect.escapechar or ''), escape,
+                '|' + quote * 2 if dialect.doublequote else ''
+            )
+            field = '(?P<quoted>{}{})|{}'.format(quoted, unquoted, unquoted)
+        self.field_re = re.compile('{}(?P<field>{})(?P<delimiter>{})?'.format(
+            ' *' if dialect.skipinitialspace else '', field,
+            re.escape(dialect.delimiter)
+        ))
+        self.quoting = 'quoted' in self.field_re.groupindex
+
+    def spans(self, text):
+        # The `(start, end, quoted)` of the fields of the row `text`
+        match_field = self.field_re.match
+        quoting = self.quoting
+        spans = []
+        position = 0
+        while True:
+            match = match_field(text, position)
+            start, end = match.span('field')
+            spans.append((start, end,
+                          quoting and match.group('quoted') is not None))
+            if match.group('delimiter') is None:
+                return spans
+            position = match.end()
+
+    def field(self, value, quoted, alone=False):
+        # The text of a field with `value`, quoted if the field it replaces
+        # was, otherwise only when it has to be. An empty field `alone` in
+        # its row is quoted, or the row would be read as an empty line.
+        dialect = self.dialect
+        quote = dialect.quotechar
+        if (self.quoting and dialect.skipinitialspace and
+                value.startswith(' ')):
+            quoted = True
+        if not quoted or not (dialect.doublequote or dialect.escapechar):
+            # The writer quotes or escapes the characters of its line
+            # terminator, so it's given one with both line breaks
+            return (self.row([value], '\r\n')[:-2] if value or alone
+                    else '')
+        escape = dialect.escapechar
+        if escape:
+            value = value.replace(escape, escape * 2)
+        if dialect.doublequote:
+            value = value.replace(quote, quote * 2)
+        else:
+            value = value.replace(quote, escape + quote)
+        return quote + value + quote
+
+    def row(self, row, ending=''):
+        import csv
+
+        writer = self.writers.get(ending)
+        if writer is None:
+            writer = self.writers[ending] = csv.writer(
+                self.buffer, **dict(self.fmtparams, lineterminator=ending)
+            )
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        writer.writerow(row)
+        return self.buffer.getvalue()
+
+
+def _reshape_jsonl_batch(lines, reshaper, paths):
+    reshape = _batch_reshape(reshaper)
+    reshapes_ascii = _worker_reshaper(reshaper)._reshapes_ascii
+    scanner = _JsonScanner(paths)
+    result = []
+    for line in lines:
+        if not line.strip() or not (reshapes_ascii or
+                                    NON_ASCII_JSON_RE.search(line)):
+            result.append(line)
+            continue
+        # The strings that change are written in place of the ones read, so
+        # the numbers, escapes and spacing of the rest of the line are kept
+        text = line.decode('utf-8')
+        pieces = []
+        position = 0
+        for start, end, string in scanner.strings(text):
+            reshaped = reshape(string)
+            if reshaped != string:
+                pieces.append(text[position:start])
+                pieces.append(scanner.encode_string(reshaped))
+                position = end
+        if not pieces:
+            result.append(line)
+            continue
+        pieces.append(text[position:])
+        result.append(''.join(pieces).encode('utf-8'))
+    return result
+
+
+def _paths_tree(paths):
+    # The paths as nested dicts of `key: [paths below, whether a path ends
+    # here]`
+    tree = {}
+    for path in paths:
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, [{}, False])[0]
+        node.setdefault(path[-1], [{}, False])[1] = True
+    return tree
+
+
+class _JsonScanner(object):
+    # Finds the strings at the paths of a JSON text. The lists met along a
+    # path are gone through item by item, and the strings in a list at the
+    # end of a path are found too, the values off the paths are only checked
+    # to be valid.
+
+    def __init__(self, paths):
+        import json
+        from json.decoder import scanstring
+        from json.encoder import encode_basestring
+
+        self.paths = paths
+        self.scanstring = scanstring
+        self.encode_string = encode_basestring
+        self.decoder = json.JSONDecoder()
+        self.error = json.JSONDecodeError
+
+    def strings(self, text):
+        # The `(start, end, string)` of the strings at the paths in `text`
+        self.text = text
+        self.found = []
+        end = self.scan(self.skip(0), self.paths, False)
+        if self.skip(end) != len(text):
+            raise self.error('Extra data', text, end)
+        return self.found
+
+    def scan(self, position, paths, path_end):
+        # Scan the value at `position`, the paths are the ones below it and
+        # `path_end` is True at the end of a path, or 'item' for the items of
+        # a list at the end of one. Returns where the value ends.
+        text = self.text
+        char = text[position:position + 1]
+        if char == '"' and path_end:
+            string, end = self.scanstring(text, position + 1)
+            self.found.append((position, end, string))
+            return end
+        if char == '[' and (paths or path_end is True):
+            return self.scan_items(position + 1, ']', paths,
+                                   path_end is True and 'item')
+        if char == '{' and paths:
+            return self.scan_items(position + 1, '}', paths, None)
+        return self.decoder.raw_decode(text, position)[1]
+
+    def scan_items(self, position, closing, paths, item_end):
+        # The items of a list, or the members of an object when `item_end`
+        # is None
+        text = self.text
+        delimiter = JSON_DELIMITER_RE.match
+        position = self.skip(position)
+        if text[position:position + 1] == closing:
+            return position + 1
+        while True:
+            if item_end is None:
+                if text[position:position + 1] != '"':
+                    raise self.error('Expecting property name enclosed in '
+                                     'double quotes', text, position)
+                key, position = self.scanstring(text, position + 1)
+                match = delimiter(text, position)
+                if match.group(1) != ':':
+                    raise self.error("Expecting ':' delimiter", text,
+                                     match.start(1))
+                node = paths.get(key)
+                position = self.scan(match.end(), *(node or ({}, False)))
+            else:
+                position = self.scan(position, paths, item_end)
+            match = delimiter(text, position)
+            if match.group(1) == closing:
+                return match.start(1) + 1
+            if match.group(1) != ',':
+                raise self.error("Expecting ',' delimiter", text,
+                                 match.start(1))
+            position = match.end()
+
+    def skip(self, position):
+        return JSON_WHITESPACE_RE.match(self.text, position).end()
@@ -17,7 +17,7 @@ from .ligatures import (SENTENCES_LIGATURES,
                         LETTERS_LIGATURES)
 
 try:
-    from fontTools.ttLib import TTFont
+    from fontTools.ttLib import TTFont, TTCollection
     with_font_config = True
 except ImportError:
     with_font_config = False
@@ -403,23 +403,32 @@ def auto_config(configuration=None, configuration_file=None):
     return configuration_parser['ArabicReshaper']
 
 
-def config_for_true_type_font(font_file_path,
-                              ligatures_config=ENABLE_ALL_LIGATURES):
+def _check_font_config(font_file_path):
     if not with_font_config:
         raise Exception('fonttools not installed, ' +
                         'install it then rerun this.\n' +
                         '$ pip install arabic-teshaper[with-fonttools]')
     if not font_file_path or not os.path.exists(font_file_path):
         raise Exception('Invalid path to font file')
-    ttfont = TTFont(font_file_path)
-    has_isolated = True
-    for k, v in LETTERS_ARABIC.items():
-        for table in ttfont['cmap'].tables:
-            if ord(v[ISOLATED]) in table.cmap:
-                break
-        else:
-            has_isolated = False
-            break
+
+
+def _font_codepoints(ttfont):
+    # Only the `cmap` table is needed, with `lazy=True` fontTools doesn't
+    # parse any of the other tables
+    codepoints = set()
+    for table in ttfont['cmap'].tables:
+        codepoints.update(table.cmap)
+    return codepoints
+
+
+def _config_for_codepoints(codepoints, ligatures_config):
+    # Only the letters with an isolated presentation form need a glyph for
+    # it, the others, like the join causing Tatweel and its variants or the
+    # letters Unicode has no presentation forms for, are left as they are
+    has_isolated = all(
+        ord(v[ISOLATED]) in codepoints for k, v in LETTERS_ARABIC.items()
+        if v[ISOLATED] != k
+    )
 
     configuration = {
         'use_unshaped_instead_of_isolated': not has_isolated,
@@ -427,14 +436,10 @@ def config_for_true_type_font(font_file_path,
 
     def process_ligatures(ligatures):
         for ligature in ligatures:
-            forms = list(filter(lambda form: form != '', ligature[1][1]))
-            n = len(forms)
-            for form in forms:
-                for table in ttfont['cmap'].tables:
-                    if ord(form) in table.cmap:
-                        n -= 1
-                        break
-            configuration[ligature[0]] = (n == 0)
+            forms = filter(lambda form: form != '', ligature[1][1])
+            configuration[ligature[0]] = all(
+                ord(form) in codepoints for form in forms
+            )
 
     if ENABLE_SENTENCES_LIGATURES & ligatures_config:
         process_ligatures(SENTENCES_LIGATURES)
@@ -446,3 +451,79 @@ def config_for_true_type_font(font_file_path,
         process_ligatures(LETTERS_LIGATURES)
 
     return configuration
+
+
+def config_for_true_type_font(font_file_path,
+                              ligatures_config=ENABLE_ALL_LIGATURES,
+                              font_number=-1):
+    """
+    Generate a configuration for the font in `font_file_path`, for TrueType
+    collections (.ttc) `font_number` selects the face to read.
+    """
+    _check_font_config(font_file_path)
+    ttfont = TTFont(font_file_path, fontNumber=font_number, lazy=True)
+    try:
+        return _config_for_codepoints(_font_codepoints(ttfont),
+                                      ligatures_config)
+    finally:
+        ttfont.close()
+
+
+def glyphs_for_true_type_font(font_file_path, font_number=-1):
+    """
+    Return the set of codepoints the font in `font_file_path` has glyphs for,
+    to be passed as `font_glyphs` to `ArabicReshaper`.
+    """
+    _check_font_config(font_file_path)
+    ttfont = TTFont(font_file_path, fontNumber=font_number, lazy=True)
+    try:
+        return _font_codepoints(ttfont)
+    finally:
+        ttfont.close()
+
+
+def _configs_for_font_file(font_file_path, ligatures_config):
+    _check_font_config(font_file_path)
+    with open(font_file_path, 'rb') as font_file:
+        is_collection = font_file.read(4) == b'ttcf'
+    if is_collection:
+        fonts = TTCollection(font_file_path, lazy=True).fonts
+    else:
+        fonts = [TTFont(font_file_path, lazy=True)]
+    try:
+        return [
+            _config_for_codepoints(_font_codepoints(ttfont), ligatures_config)
+            for ttfont in fonts
+        ]
+    finally:
+        for ttfont in fonts:
+            ttfont.close()
+
+
+def configs_for_fonts(font_file_paths,
+                      ligatures_config=ENABLE_ALL_LIGATURES,
+                      workers=None):
+    """
+    Generate configurations for many font files at once, using a pool of
+    `workers` processes (defaults to the number of CPUs, `1` disables the
+    pool).
+
+    Returns a dictionary mapping each path to a list of configurations, one
+    per face, so a plain font gets a list of one configuration and a TrueType
+    collection (.ttc) gets one configuration for each font it contains. The
+    configurations are plain dictionaries, so the result can be stored as
+    JSON and passed later to `ArabicReshaper`.
+    """
+    font_file_paths = list(font_file_paths)
+    ligatures_configs = [ligatures_config] * len(font_file_paths)
+    if workers == 1 or len(font_file_paths) < 2:
+        results = map(_configs_for_font_file,
+                      font_file_paths, ligatures_configs)
+        return dict(zip(font_file_paths, results))
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_configs_for_font_file,
+                               font_file_paths, ligatures_configs,
+                               chunksize=8)
+        return dict(zip(font_file_paths, results))
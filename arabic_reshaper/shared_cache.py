@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# A cache of reshaped strings in shared memory, for servers that run many
+# worker processes: every worker reads the entries the others wrote, without
+# any round trip to another process, and a new worker starts warm.
+#
+# The shared memory block holds a header, a fixed size open addressing table
+# of (hash, position) slots, and an arena the entries are written to one
+# after the other as in a ring buffer, so the oldest entries are the ones
+# overwritten when it's full. Positions only grow, the place of an entry in
+# the arena is its position modulo the size of the arena.
+#
+# Readers don't take any lock, an entry is only used if its header has the
+# position of the slot, its key is the one looked up, the CRC-32 of its value
+# matches, and it wasn't overwritten while it was read. Writers are
+# serialized by a lock when the cache has one, otherwise concurrent writers
+# may spoil each other's entries, which are then missed by the readers.
+
+import atexit
+import os
+import struct
+import sys
+import weakref
+import zlib
+
+with_shared_memory = sys.version_info >= (3, 8)
+
+MAGIC = 0x48434148535241  # 'ARSHACH'
+
+# Magic, number of slots, size of the arena and write position, then padding
+HEADER = struct.Struct('<QQQQ32x')
+WRITE_POSITION = 3
+
+# Position of the entry, length of the key, length of the value and CRC-32 of
+# the value, followed by the key and the value
+ENTRY = struct.Struct('<QIII4x')
+
+# Slots tried for a key before giving up, or replacing the oldest one
+PROBES = 8
+
+# Entries are aligned to 8 bytes
+ALIGNMENT = 8
+
+# Names of the blocks created by this process, or the process it was forked
+# from
+_created_names = set()
+
+
+class SharedResultCache(object):
+    """
+    A cache of reshaped strings in the shared memory block `name`, created
+    with room for `slots` entries and `arena_size` bytes of keys and values if
+    it doesn't exist yet, otherwise the existing block is used.
+
+    Pass it as the `cache` of an `ArabicReshaper`. Create it in the parent
+    process before the workers are started (forked), like the master process
+    of gunicorn with `preload_app`, then the writes of the workers are
+    serialized by a lock they all inherit. Processes that attach to the block
+    by its name write without a lock, unless `lock` is given, that can only
+    make them miss some entries.
+
+    The block is removed when the process that created it exits, or when
+    `unlink` is called. `close` ends the access of a process to the block, it
+    is also closed when the cache is garbage collected, or at the end of a
+    `with` block:
+
+        with SharedResultCache(name) as cache:
+            ...
+    """
+
+    def __init__(self, name=None, slots=1 << 16, arena_size=16 << 20,
+                 lock=None):
+        if not with_shared_memory:
+            raise Exception('multiprocessing.shared_memory not available, ' +
+                            'it needs Python 3.8 or later.')
+        from multiprocessing import Lock
+        from multiprocessing.shared_memory import SharedMemory
+
+        if slots & (slots - 1) or arena_size % ALIGNMENT:
+            raise ValueError('slots should be a power of 2 and arena_size a '
+                             'multiple of {}'.format(ALIGNMENT))
+        size = HEADER.size + slots * 16 + arena_size
+        try:
+            self._memory = SharedMemory(name, create=True, size=size)
+            _created_names.add(self._memory.name)
+            atexit.register(_unlink_at_exit, self._memory.name, os.getpid())
+            created = True
+        except FileExistsError:
+            self._memory = _attach(name)
+            created = False
+
+        buffer = self._memory.buf
+        header = buffer[:HEADER.size].cast('Q')
+        if created:
+            header[1] = slots
+            header[2] = arena_size
+            header[WRITE_POSITION] = 0
+            header[0] = MAGIC
+            if lock is None:
+                lock = Lock()
+        elif header[0] != MAGIC:
+            header.release()
+            self._memory.close()
+            raise ValueError(
+                'Shared memory {!r} is not a reshaper cache'.format(name)
+            )
+        slots, arena_size = header[1], header[2]
+        table_end = HEADER.size + slots * 16
+
+        self._header = header
+        self._table = buffer[HEADER.size:table_end].cast('Q')
+        self._arena = buffer[table_end:table_end + arena_size]
+        # The views of the block have to be released before it's closed,
+        # `SharedMemory` can't close it otherwise
+        self._finalizer = weakref.finalize(
+            self, _close, (self._header, self._table, self._arena),
+            self._memory
+        )
+        self._mask = slots - 1
+        self._arena_size = arena_size
+        self._max_entry_size = arena_size // 16
+        self._lock = lock
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    def get(self, key):
+        """
+        Return the value cached for the bytes `key`, or None.
+        """
+        hash_ = zlib.crc32(key) + 1
+        table = self._table
+        index = hash_ & self._mask
+        for _ in range(PROBES):
+            slot_hash = table[2 * index]
+            if not slot_hash:
+                return None
+            if slot_hash == hash_:
+                value = self._read(table[2 * index + 1], key)
+                if value is not None:
+                    return value
+            index = (index + 1) & self._mask
+        return None
+
+    def set(self, key, value):
+        """
+        Cache the string `value` for the bytes `key`, unless it's too large
+        for the arena.
+        """
+        value = value.encode('utf-8', 'surrogatepass')
+        size = ENTRY.size + len(key) + len(value)
+        size += -size % ALIGNMENT
+        if size > self._max_entry_size:
+            return
+        if self._lock is None:
+            self._write(key, value, size)
+        else:
+            with self._lock:
+                self._write(key, value, size)
+
+    def clear(self):
+        """
+        Drop all the entries.
+        """
+        if self._lock is None:
+            self._clear()
+        else:
+            with self._lock:
+                self._clear()
+
+    def close(self):
+        """
+        Close this process's access to the shared memory block.
+        """
+        self._finalizer()
+
+    def unlink(self):
+        """
+        Remove the shared memory block, the processes that use it keep their
+        access until they close it.
+        """
+        self._memory.unlink()
+        _created_names.discard(self._memory.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _read(self, position, key):
+        arena_size = self._arena_size
+        if position + arena_size < self._header[WRITE_POSITION]:
+            return None  # Overwritten
+        offset = position % arena_size
+        entry_position, key_length, value_length, crc = ENTRY.unpack_from(
+            self._arena, offset
+        )
+        if entry_position != position or key_length != len(key):
+            return None
+        start = offset + ENTRY.size
+        end = start + key_length + value_length
+        if end > arena_size or self._arena[start:start + key_length] != key:
+            return None
+        value = bytes(self._arena[start + key_length:end])
+        if zlib.crc32(value) != crc:
+            return None
+        if position + arena_size < self._header[WRITE_POSITION]:
+            return None  # Overwritten while it was read
+        return value.decode('utf-8', 'surrogatepass')
+
+    def _write(self, key, value, size):
+        arena_size = self._arena_size
+        header = self._header
+        position = header[WRITE_POSITION]
+        offset = position % arena_size
+        if offset + size > arena_size:
+            # Entries don't wrap around, the end of the arena is skipped
+            position += arena_size - offset
+            offset = 0
+        # The position is moved first so readers know that the entries
+        # being overwritten are gone
+        header[WRITE_POSITION] = position + size
+        ENTRY.pack_into(self._arena, offset, position, len(key), len(value),
+                        zlib.crc32(value))
+        start = offset + ENTRY.size
+        self._arena[start:start + len(key)] = key
+        self._arena[start + len(key):start + len(key) + len(value)] = value
+
+        # The slot goes to the first empty, same key or overwritten slot,
+        # otherwise it replaces the oldest entry
+        hash_ = zlib.crc32(key) + 1
+        table = self._table
+        oldest = index = hash_ & self._mask
+        for _ in range(PROBES):
+            slot_hash = table[2 * index]
+            slot_position = table[2 * index + 1]
+            if (not slot_hash or slot_hash == hash_ or
+                    slot_position + arena_size < position + size):
+                break
+            if slot_position < table[2 * oldest + 1]:
+                oldest = index
+            index = (index + 1) & self._mask
+        else:
+            index = oldest
+        table[2 * index] = 0
+        table[2 * index + 1] = position
+        table[2 * index] = hash_
+
+    def _clear(self):
+        table = self._table
+        for i in range(len(table)):
+            table[i] = 0
+        self._header[WRITE_POSITION] = 0
+
+
+def _attach(name):
+    from multiprocessing.shared_memory import SharedMemory
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    # Before Python 3.13 the resource tracker would remove the block when
+    # this process exits, even though it didn't create it. The tracker keeps
+    # one registration of each name, so it's left for the creator's `unlink`
+    # when the block was created by this process, or the tracker is shared
+    # with the process this one was forked or spawned from
+    memory = SharedMemory(name)
+    if (sys.platform != 'win32' and memory.name not in _created_names and
+            _owns_resource_tracker()):
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(memory._name, 'shared_memory')
+    return memory
+
+
+def _close(views, memory):
+    for view in views:
+        view.release()
+    memory.close()
+
+
+def _unlink_at_exit(name, pid):
+    # Forked processes run the exit functions of their parent too
+    if os.getpid() != pid or name not in _created_names:
+        return
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        SharedMemory(name).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _owns_resource_tracker():
+    from multiprocessing import resource_tracker
+
+    pid = resource_tracker._resource_tracker._pid
+    if pid is None:
+        return False
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return False
+    return True
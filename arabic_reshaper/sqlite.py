@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# `reshape` and `unreshape` as SQLite functions, so queries can reshape their
+# results, or the rows of a table in an `UPDATE`, inside the database.
+# sqlite3 is only imported once a connection is given, importing the package
+# shouldn't load it.
+
+import sys
+from functools import lru_cache
+
+
+def register_sqlite_functions(connection, reshaper=None,
+                              cache_size=None):
+    """
+    Register `reshape(text)` and `unreshape(text)` as functions of the
+    SQLite `connection`, backed by `reshaper` (defaults to
+    `default_reshaper`):
+
+        SELECT reshape(name) FROM cities
+        UPDATE cities SET name = reshape(name)
+
+    Values that aren't text, like NULL, are returned as they are. When
+    `cache_size` is given, the results of that many distinct texts are kept
+    for each function, which helps when the same values repeat over many
+    rows.
+
+    The functions are registered as deterministic where SQLite supports it
+    (Python 3.8 and SQLite 3.8.3 or later), so SQLite can call them once for
+    the same value in a query, and they can be used in indexes.
+    """
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+
+    for name, function in (('reshape', reshaper.reshape),
+                           ('unreshape', reshaper.unreshape)):
+        if cache_size:
+            function = lru_cache(maxsize=cache_size)(function)
+        _create_function(connection, name, _text_function(function))
+
+
+def _text_function(function):
+    def text_function(value):
+        return function(value) if isinstance(value, str) else value
+    return text_function
+
+
+def _create_function(connection, name, function):
+    if sys.version_info >= (3, 8):
+        import sqlite3
+        try:
+            connection.create_function(name, 1, function, deterministic=True)
+            return
+        except sqlite3.NotSupportedError:
+            pass
+    connection.create_function(name, 1, function)
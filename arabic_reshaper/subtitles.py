@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Streaming SubRip (.srt) and WebVTT (.vtt) subtitles through the reshaper.
+#
+# Both formats are blocks of lines separated by blank lines, a cue is a block
+# with a timing line (`00:00:01,000 --> 00:00:02,000`) followed by the lines
+# of its text, so the lines after a timing line up to the next blank line are
+# the only ones reshaped. Indexes, cue identifiers, timings, headers, notes
+# and styles are copied byte for byte, and so are the styling tags in the
+# text (`<i>`, `<font color="...">`, `<c.yellow>`, `<v Speaker>`,
+# `{\an8}`...), the letters around a tag are joined as if it wasn't there.
+
+import os
+import re
+
+# Lines that may have characters the reshaper changes
+NON_ASCII_RE = re.compile(b'[\x80-\xff]')
+
+LINE_ENDING_RE = re.compile(b'\r?\n$|\r$')
+
+TAGS_RE = re.compile(r'(<[^<>\n]*>|\{\\[^{}\n]*\})')
+
+BATCH_SIZE = 100
+
+
+def reshape_subtitles(input, output, reshaper=None, encoding='utf-8',
+                      batch_size=BATCH_SIZE):
+    """
+    Reshape the cue text of the SubRip or WebVTT subtitles `input` and write
+    the result to `output`, both binary file objects. Returns the number of
+    cues.
+
+    The file is read line by line and written `batch_size` cues at a time,
+    with `reshaper` (defaults to `default_reshaper`). `encoding` is the
+    encoding of the file, it has to be a superset of ASCII and able to
+    encode the presentation forms of the letters.
+    """
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+    reshapes_ascii = reshaper._reshapes_ascii
+
+    count = 0
+    written = 0
+    lines = []
+    cue_lines = []
+    in_cue = False
+    for line in input:
+        if not line.strip():
+            in_cue = False
+            if count - written >= batch_size:
+                _reshape_cue_lines(lines, cue_lines, reshaper, encoding)
+                output.write(b''.join(lines))
+                del lines[:], cue_lines[:]
+                written = count
+        elif in_cue:
+            if reshapes_ascii or NON_ASCII_RE.search(line):
+                cue_lines.append(len(lines))
+        elif b'-->' in line:
+            in_cue = True
+            count += 1
+        lines.append(line)
+    _reshape_cue_lines(lines, cue_lines, reshaper, encoding)
+    output.write(b''.join(lines))
+    return count
+
+
+def reshape_subtitle_files(files, reshaper=None, encoding='utf-8',
+                           workers=None, batch_size=BATCH_SIZE):
+    """
+    Reshape the subtitles of `files`, an iterable of `(input path, output
+    path)` pairs, with `reshape_subtitles`, in `workers` processes (`None`
+    for the number of CPUs, `1` to reshape them in this process). Returns
+    the list of the numbers of cues of the files.
+    """
+    if reshaper is None:
+        from .arabic_reshaper import default_reshaper
+        reshaper = default_reshaper
+    files = list(files)
+
+    if workers == 1 or len(files) < 2:
+        return [_reshape_subtitle_file(input_path, output_path, reshaper,
+                                       encoding, batch_size)
+                for input_path, output_path in files]
+
+    from concurrent.futures import ProcessPoolExecutor
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    arguments = reshaper._worker_arguments
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_reshape_subtitle_file, input_path,
+                                   output_path, arguments, encoding,
+                                   batch_size)
+                   for input_path, output_path in files]
+        return [future.result() for future in futures]
+
+
+def _reshape_subtitle_file(input_path, output_path, reshaper, encoding,
+                           batch_size):
+    if isinstance(reshaper, tuple):
+        from .arabic_reshaper import _worker_reshaper
+        reshaper = _worker_reshaper(reshaper)
+    with open(input_path, 'rb') as input, open(output_path, 'wb') as output:
+        return reshape_subtitles(input, output, reshaper, encoding,
+                                 batch_size)
+
+
+def _reshape_cue_lines(lines, indexes, reshaper, encoding):
+    # Reshape the `lines` at `indexes` in place, the lines without tags are
+    # reshaped as one text when it can be cut at its line breaks after
+    texts = []
+    endings = []
+    plain = []
+    for i in indexes:
+        line = lines[i]
+        ending = LINE_ENDING_RE.search(line)
+        ending = ending.group() if ending else b''
+        text = line[:len(line) - len(ending)].decode(encoding)
+        parts = TAGS_RE.split(text)
+        if len(parts) == 1:
+            plain.append(len(texts))
+        else:
+            # The text between the tags is reshaped as runs of one text
+            parts[::2] = [
+                run for run, _ in
+                reshaper.reshape_runs((part, None) for part in parts[::2])
+            ]
+            text = ''.join(parts)
+        texts.append(text)
+        endings.append(ending)
+
+    if plain:
+        text = '\n'.join(texts[i] for i in plain)
+        reshaped = None
+        if not reshaper._unsafe_word_breaks_re.search(text):
+            reshaped = reshaper.reshape(text).split('\n')
+        if reshaped is None or len(reshaped) != len(plain):
+            reshaped = [reshaper.reshape(texts[i]) for i in plain]
+        for i, text in zip(plain, reshaped):
+            texts[i] = text
+
+    for i, text, ending in zip(indexes, texts, endings):
+        lines[i] = text.encode(encoding) + ending
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Written by Abdullah Diab (mpcabd)
+# Email: mpcabd@gmail.com
+# Website: http://mpcabd.xyz
+
+# Templates in the `str.format` syntax that are reshaped once, see
+# `ArabicReshaper.compile_template`.
+#
+# The literal text of a template is cut where the reshaper can cut a text
+# without changing the result (see `_segment_breaks_re`), a cut only depends
+# on the characters on both sides of it, so the cuts found inside a literal
+# are cuts of every text the template renders. The text between the first
+# and the last cut of a literal is reshaped when the template is compiled.
+# The characters before the first cut and after the last one may join the
+# values next to them, when rendering they are reshaped with the values
+# unless the edges of the values turn out to be cuts too.
+
+from string import Formatter
+
+
+class CompiledTemplate(object):
+    """
+    A template in the `str.format` syntax compiled by
+    `ArabicReshaper.compile_template`, `format` renders it and reshapes the
+    result.
+    """
+
+    def __init__(self, reshaper, template):
+        self.reshaper = reshaper
+        self.template = template
+
+        # The parts are reshaped strings, or lists of the indexes of the
+        # fields and the `(literal, reshaped literal)` pairs between them,
+        # which are reshaped together when rendering
+        self._breaks_re = reshaper._segment_breaks_re
+        self._fields = []
+        self._parts = []
+        numbering = _FieldNumbering()
+        parsed = list(Formatter().parse(template))
+        breaks_re = self._breaks_re
+        group = []
+        for i, (literal, field_name, format_spec, conversion) in enumerate(
+                parsed):
+            # `Formatter.parse` also splits the literal text at escaped
+            # braces, with no field between the parts
+            first = i == 0
+            last = i == len(parsed) - 1 and field_name is None
+            cuts = [match.end() for match in breaks_re.finditer(literal)
+                    if last or match.end() < len(literal)]
+            start = 0 if first else cuts[0] if cuts else None
+            end = len(literal) if last else cuts[-1] if cuts else None
+            if start is None or end is None or start > end:
+                group.append(literal)
+            else:
+                group.append(literal[:start])
+                self._add_group(group)
+                self._parts.append(reshaper.reshape(literal[start:end]))
+                group = [literal[end:]]
+            if field_name is not None:
+                group.append(len(self._fields))
+                self._fields.append(
+                    numbering.field(field_name, conversion, format_spec)
+                )
+        self._add_group(group)
+
+    def _add_group(self, group):
+        group = [piece for piece in group if piece != '']
+        if any(isinstance(piece, int) for piece in group):
+            self._parts.append([
+                piece if isinstance(piece, int)
+                else (piece, self.reshaper.reshape(piece))
+                for piece in group
+            ])
+        elif group:
+            self._parts.append(self.reshaper.reshape(''.join(group)))
+
+    def format(self, *args, **kwargs):
+        """
+        Render the template like `str.format` and return the reshaped
+        result, which is the same as `reshape(template.format(...))`.
+        """
+        values = [field.format(*args, **kwargs) for field in self._fields]
+        reshape = self.reshaper.reshape
+        is_break = self._breaks_re.match
+        result = []
+        for part in self._parts:
+            if isinstance(part, str):
+                result.append(part)
+                continue
+            # The pieces of the group are reshaped alone when the edges
+            # between them are cuts, otherwise with their neighbours
+            texts = []
+            reshaped = None
+            for piece in part:
+                if isinstance(piece, int):
+                    text, piece_reshaped = values[piece], None
+                else:
+                    text, piece_reshaped = piece
+                if not text:
+                    continue
+                if texts and not is_break(texts[-1][-1] + text[0]):
+                    texts.append(text)
+                    reshaped = None
+                    continue
+                if texts:
+                    result.append(reshape(''.join(texts)) if reshaped is None
+                                  else reshaped)
+                texts = [text]
+                reshaped = piece_reshaped
+            if texts:
+                result.append(reshape(''.join(texts)) if reshaped is None
+                              else reshaped)
+        return ''.join(result)
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.template)
+
+
+class _FieldNumbering(object):
+    # Each field of a template is formatted alone, so the automatically
+    # numbered fields (`{}`) are given their numbers like `str.format` does
+
+    def __init__(self):
+        self.next = 0
+        self.automatic = None
+
+    def field(self, field_name, conversion, format_spec):
+        # The format string of a field alone
+        if field_name[:1] in ('', '.', '['):
+            if self.automatic is False:
+                raise ValueError('cannot switch from manual field '
+                                 'specification to automatic field numbering')
+            self.automatic = True
+            field_name = str(self.next) + field_name
+            self.next += 1
+        elif field_name.split('.', 1)[0].split('[', 1)[0].isdigit():
+            if self.automatic:
+                raise ValueError('cannot switch from automatic field '
+                                 'numbering to manual field specification')
+            self.automatic = False
+
+        if format_spec:
+            format_spec = ''.join(
+                literal.replace('{', '{{').replace('}', '}}') +
+                ('' if name is None else self.field(name, conv, spec))
+                for literal, name, spec, conv in Formatter().parse(
+                    format_spec
+                )
+            )
+        return '{' + field_name + ('!' + conversion if conversion else '') + (
+            ':' + format_spec if format_spec else '') + '}'
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import io
 import unittest
 import sys
 import arabic_reshaper
 import arabic_reshaper.letters as letters
+import arabic_reshaper.ligatures
 
 
 def _reshaping_test(test):
@@ -140,6 +142,9 @@ class TestReshapingWithHarakat(unittest.TestCase):
             ('في 18 ديسمبر كذكرى اعتماد',  'ﻓﻲ 18 ﺩﻳﺴﻤﺒﺮ ﻛﺬﻛﺮﻯ ﺍﻋﺘﻤﺎﺩ'),
             ('العربية بين لغات العمل في',  'ﺍﻟﻌﺮﺑﻴﺔ ﺑﻴﻦ ﻟﻐﺎﺕ ﺍﻟﻌﻤﻞ ﻓﻲ'),
             ('الأمم المتحدة.', 'ﺍﻷﻣﻢ ﺍﻟﻤﺘﺤﺪﺓ.'),
+            ('فُعِّلَ', 'ﻓُﻌِّﻞَ'),
+            ('ٱلرَّحْمَـٰنِ', 'ﭐﻟﺮَّﺣْﻤَـٰﻦِ'),
+            ('َبسم', 'َﺑﺴﻢ'),
         )
 
     def test_reshaping(self):
@@ -184,6 +189,8 @@ class TestReshapingWithShiftedHarakatWithoutLigatures(unittest.TestCase):
         self.cases = (
             ('فُعِلَ', 'ُﻓِﻌَﻞ'),
             ('فُعِّلَ', 'ُﻓِّﻌَﻞ'),
+            ('ٱلرَّحْمَـٰنِ', 'ﭐﻟَّﺮْﺣَﻤٰـِﻦ'),
+            ('َبسم', 'ﺑﺴﻢ'),
         )
 
     def test_reshaping(self):
@@ -245,5 +252,344 @@ class TestReshapingSomeLigatures(unittest.TestCase):
     def test_reshaping(self):
         _reshaping_test(self)
 
+    def test_reshape_to(self):
+        # The spaces of the sentence ligatures are not segment breaks
+        for text, expected in self.cases:
+            segments = []
+            self.reshaper.reshape_to(text, segments.append, 1)
+            self.assertEqual(expected, ''.join(segments))
+
+    def test_reshape_parallel(self):
+        text = '\n'.join(case[0] for case in self.cases)
+        expected = '\n'.join(case[1] for case in self.cases)
+        self.assertEqual(
+            expected, self.reshaper.reshape_parallel(text, 2, chunk_size=1)
+        )
+
+
+class TestReshapingAllLigatures(unittest.TestCase):
+    def setUp(self):
+        self.reshaper = arabic_reshaper.ArabicReshaper({
+            ligature: True
+            for ligature, _ in arabic_reshaper.ligatures.LIGATURES
+        })
+        self.cases = (
+            ('محمد رسول الله صلى الله عليه وسلم',
+             'ﷴ ﷶ ﷲ ﷺ'),
+            ('الله جل جلاله',
+             'ﷲ ﷻ'),
+            ('محمد رسول الله عليه صلى الله وسلم',
+             'ﷴ ﷶ ﷲ ﷷ ﷹ ﷲ ﷸ'),
+            ('سعر المنتج ١٥٠ ريال',
+             'ﺳﻌﺮ ﺍﳌﻨﺘﺞ ١٥٠ ﷼'),
+            ('لا إله إلا الله',
+             'ﻻ ﺇﻟﻪ ﺇﻻ ﷲ'),
+            ('بسم الله الرحمن الرحيم',
+             '﷽'),
+        )
+
+    def test_reshaping(self):
+        _reshaping_test(self)
+
+    def test_expand_ligature_pattern(self):
+        expand = arabic_reshaper.arabic_reshaper._expand_ligature_pattern
+        self.assertEqual(expand('ر[یي]ال'), ['ریال', 'ريال'])
+        self.assertEqual(expand('a(?:b|c)(?:d|e)'),
+                         ['abd', 'abe', 'acd', 'ace'])
+        self.assertIsNone(expand('ab*'))
+
+
+class TestReshapingWithFontGlyphs(unittest.TestCase):
+    def setUp(self):
+        BEH = 'ب'
+        BEH_FORMS = letters.LETTERS_ARABIC[BEH]
+        ALEF = 'ا'
+        ALEF_FORMS = letters.LETTERS_ARABIC[ALEF]
+
+        # A font that has all the forms except BEH medial and ALEF isolated
+        font_glyphs = set(
+            ord(form)
+            for forms in letters.LETTERS_ARABIC.values()
+            for form in forms if form
+        )
+        font_glyphs.discard(ord(BEH_FORMS[letters.MEDIAL]))
+        font_glyphs.discard(ord(ALEF_FORMS[letters.ISOLATED]))
+
+        self.reshaper = arabic_reshaper.ArabicReshaper(
+            font_glyphs=font_glyphs
+        )
+        self.cases = (
+            (BEH + BEH + BEH, BEH_FORMS[letters.INITIAL] + BEH +
+             BEH_FORMS[letters.FINAL]),
+            (BEH + ' ' + ALEF, BEH_FORMS[letters.ISOLATED] + ' ' + ALEF),
+            (BEH + ALEF, BEH_FORMS[letters.INITIAL] +
+             ALEF_FORMS[letters.FINAL]),
+        )
+
+    def test_reshaping(self):
+        _reshaping_test(self)
+
+
+class TestReshapingMixedText(unittest.TestCase):
+    def setUp(self):
+        self.reshaper = arabic_reshaper.ArabicReshaper({
+            'delete_harakat': False,
+            'shift_harakat_position': True,
+        })
+        self.cases = (
+            ('Hello, World!\n', 'Hello, World!\n'),
+            ('log: سلام x َ y', 'log: ﺳﻼﻡ xَ  y'),
+            ('ab َ', 'abَ '),
+            ('Total: 150 ريال', 'Total: 150 ﺭﻳﺎﻝ'),
+            ('ب' + letters.ZWJ + 'ب الله', 'ﺑﺐ ﷲ'),
+        )
+
+    def test_reshaping(self):
+        _reshaping_test(self)
+
+    def test_unchanged_text(self):
+        text = '{"level": "info", "path": "/api/v1/items", "ms": 12.5}'
+        self.assertIs(text, self.reshaper.reshape(text))
+
+    def test_reshape_to(self):
+        text = '\n'.join(case[0] for case in self.cases) + '.فُعِّلَ'
+        expected = self.reshaper.reshape(text)
+        for segment_size in (1, 5, len(text)):
+            segments = []
+            self.reshaper.reshape_to(text, segments.append, segment_size)
+            self.assertEqual(expected, ''.join(segments))
+            if segment_size < len(text):
+                self.assertGreater(len(segments), 1)
+
+        sink = io.StringIO()
+        self.reshaper.reshape_to(text, sink)
+        self.assertEqual(expected, sink.getvalue())
+
+    def test_iter_reshape(self):
+        text = '\n'.join(case[0] for case in self.cases) + '.فُعِّلَ'
+        expected = self.reshaper.reshape(text)
+        segments = list(self.reshaper.iter_reshape(text, 5))
+        self.assertGreater(len(segments), 1)
+        self.assertEqual(expected, ''.join(segments))
+
+        # Strings cut anywhere, even before Harakat, give the same result
+        for size in (1, 2, 7):
+            chunks = (text[i:i + size] for i in range(0, len(text), size))
+            self.assertEqual(
+                expected, ''.join(self.reshaper.iter_reshape(chunks, 5))
+            )
+
+    def test_reshape_parallel(self):
+        text = '\n'.join(case[0] for case in self.cases) * 10
+        expected = self.reshaper.reshape(text)
+        for workers in (1, 2):
+            self.assertEqual(
+                expected,
+                self.reshaper.reshape_parallel(text, workers, chunk_size=16)
+            )
+
+    def test_reshape_bytes(self):
+        out = bytearray(b'previous content')
+        for text, expected in self.cases:
+            data = text.encode('utf-8')
+            expected = expected.encode('utf-8')
+            self.assertEqual(expected, self.reshaper.reshape_bytes(data))
+            before = bytes(out)
+            size = self.reshaper.reshape_into(memoryview(data), out)
+            self.assertEqual(len(expected), size)
+            self.assertEqual(expected, out[:size])
+            # The buffer isn't truncated
+            self.assertEqual(before[size:], out[size:])
+            self.assertEqual(max(len(before), size), len(out))
+
+
+class TestReshapingWithOverrides(unittest.TestCase):
+    def setUp(self):
+        self.reshaper = arabic_reshaper.ArabicReshaper({
+            'delete_harakat': False,
+        })
+
+    def test_overrides(self):
+        text = 'فُعِّلَ الله جل جلاله'
+        for overrides in (
+            {'delete_harakat': True},
+            {'shift_harakat_position': True, 'support_ligatures': False},
+            {'ARABIC LIGATURE ALLAH': False,
+             'ARABIC LIGATURE JALLAJALALOUHOU': True},
+        ):
+            configuration = {'delete_harakat': False}
+            configuration.update(overrides)
+            self.assertEqual(
+                arabic_reshaper.ArabicReshaper(configuration).reshape(text),
+                self.reshaper.reshape(text, **overrides)
+            )
+        self.assertEqual('ﻓُﻌِّﻞَ', self.reshaper.reshape('فُعِّلَ'))
+
+    def test_variants_cache(self):
+        variant = self.reshaper._variant({'delete_harakat': True})
+        self.assertIs(variant,
+                      self.reshaper._variant({'delete_harakat': True}))
+        for i in range(arabic_reshaper.arabic_reshaper.VARIANTS_CACHE_SIZE):
+            self.reshaper.reshape('ب', language=str(i))
+        self.assertEqual(len(self.reshaper._variants),
+                         arabic_reshaper.arabic_reshaper.VARIANTS_CACHE_SIZE)
+        self.assertIsNot(variant,
+                         self.reshaper._variant({'delete_harakat': True}))
+
+
+class TestReshapingVariants(unittest.TestCase):
+    def test_reshape_variants(self):
+        reshaper = arabic_reshaper.ArabicReshaper({'delete_harakat': False})
+        font_reshaper = arabic_reshaper.ArabicReshaper(
+            font_glyphs=[ord(forms[0]) for forms in
+                         arabic_reshaper.letters.LETTERS_ARABIC.values()]
+        )
+        configurations = (
+            {},
+            {'use_unshaped_instead_of_isolated': True},
+            {'support_ligatures': False, 'delete_harakat': True},
+            {'shift_harakat_position': True,
+             'ARABIC LIGATURE JALLAJALALOUHOU': True},
+            {'language': 'Kurdish'},
+            {'support_zwj': False},
+            {},
+            font_reshaper,
+        )
+        for text in ('', 'Hello', 'فُعِّلَ الله جل جلاله ب\u200dا',
+                     'The customer from مدينة دمشق ordered 3 items'):
+            self.assertEqual(
+                reshaper.reshape_variants(text, configurations),
+                [configuration.reshape(text)
+                 if isinstance(configuration, arabic_reshaper.ArabicReshaper)
+                 else reshaper.reshape(text, **configuration)
+                 for configuration in configurations]
+            )
+
+
+class TestReshapingRuns(unittest.TestCase):
+    def test_reshape_runs(self):
+        cases = (
+            # The letters join across the runs
+            ([('س', 'bold'), ('لام', None)],
+             [('ﺳ', 'bold'), ('ﻼﻡ', None)]),
+            # The ligature goes to the run of its first letter
+            ([('سل', 'bold'), ('ام', None)],
+             [('ﺳﻼ', 'bold'), ('ﻡ', None)]),
+            ([('Hello ', 1), ('عالم', 2), ('!', 3), ('', 4)],
+             [('Hello ', 1), ('ﻋﺎﻟﻢ', 2), ('!', 3), ('', 4)]),
+            ([], []),
+        )
+        for runs, expected in cases:
+            self.assertEqual(arabic_reshaper.reshape_runs(runs), expected)
+
+    def test_harakat(self):
+        # The Harakat go with the letters they're written after
+        reshaper = arabic_reshaper.ArabicReshaper({'delete_harakat': False})
+        self.assertEqual(reshaper.reshape_runs([('ب', 1), ('َب', 2)]),
+                         [('ﺑَ', 1), ('ﺐ', 2)])
+
+        text = 'فُعِّلَ الله جل جلاله ب\u200dا'
+        for size in (1, 2, 3):
+            runs = [(text[i:i + size], i) for i in range(0, len(text), size)]
+            reshaped_runs = reshaper.reshape_runs(runs)
+            self.assertEqual([style for _, style in reshaped_runs],
+                             [style for _, style in runs])
+            self.assertEqual(''.join(text for text, _ in reshaped_runs),
+                             reshaper.reshape(text))
+
+
+class TestCompilingTemplates(unittest.TestCase):
+    def test_compile_template(self):
+        reshaper = arabic_reshaper.ArabicReshaper({'delete_harakat': False})
+        cases = (
+            ('مرحبا {name}، لديك {count} رسائل',
+             [{'name': 'محمد', 'count': 5}, {'name': 'Ali', 'count': 'عدة'},
+              {'name': '', 'count': ''}, {'name': 'َب', 'count': 'ـ'}]),
+            # The letters next to the fields join the values
+            ('ب{x}ب{y}', [{'x': 'ب', 'y': ''}, {'x': '', 'y': 'ب'},
+                          {'x': '1', 'y': '\u200d'}]),
+            ('{0} و{1!r} {0:>6}', [{}]),
+            ('{{ب}} {} {:^{}}', [{}]),
+            ('سلام', [{}]),
+            ('', [{}]),
+        )
+        args = ('ب', 'ت', 7)
+        for template, values in cases:
+            compiled = reshaper.compile_template(template)
+            for kwargs in values:
+                self.assertEqual(
+                    compiled.format(*args, **kwargs),
+                    reshaper.reshape(template.format(*args, **kwargs))
+                )
+
+        # The literal text is split at escaped braces, the Harakat after
+        # them still go with the letters before
+        reshaper = arabic_reshaper.ArabicReshaper({
+            'delete_harakat': False,
+            'shift_harakat_position': True,
+        })
+        for template in ('بب{{َبب {x}', 'بب}}ّب {x}ب', '{x}ب{{ـَ}}'):
+            self.assertEqual(
+                reshaper.compile_template(template).format(x='س'),
+                reshaper.reshape(template.format(x='س'))
+            )
+
+        with self.assertRaises(ValueError):
+            arabic_reshaper.compile_template('{} {0}')
+        with self.assertRaises(KeyError):
+            arabic_reshaper.compile_template('{name}').format()
+
+
+class TestUnreshaping(unittest.TestCase):
+    def test_unreshape(self):
+        text = 'السلام عليكم، لا إله إلا الله محمد رسول الله'
+        for reshaper in (
+                arabic_reshaper.default_reshaper,
+                arabic_reshaper.ArabicReshaper(
+                    {'use_unshaped_instead_of_isolated': True}
+                ),
+                arabic_reshaper.ArabicReshaper(ligatures=[
+                    ('[لل]ه', ('', '', '', '')),
+                ])):
+            self.assertEqual(reshaper.unreshape(reshaper.reshape(text)),
+                             text)
+        self.assertEqual(arabic_reshaper.unreshape('ﺍﻟﺴَﻼﻡ ﷺ'),
+                         'السَلام صلى الله عليه وسلم')
+
+
+class TestReshapingWithExtraLigatures(unittest.TestCase):
+    def setUp(self):
+        self.reshaper = arabic_reshaper.ArabicReshaper(ligatures=[
+            ('ACME', ('\uE100', '\uE100', '\uE100', '\uE100')),
+            ('سلام', ('\uE200', '\uE201', '\uE202', '\uE203')),
+        ])
+
+    def test_reshaping(self):
+        self.assertEqual(self.reshaper.reshape('ACME سلام والسلام'),
+                         '\uE100 \uE200 ﻭﺍﻟ\uE203')
+        self.assertEqual(self.reshaper.reshape_bytes('xACMEx'.encode()),
+                         'x\uE100x'.encode())
+        self.assertEqual(arabic_reshaper.reshape_batch(['ACME'],
+                                                       self.reshaper),
+                         ['\uE100'])
+        self.assertEqual(self.reshaper.reshape('سلام',
+                                               support_ligatures=False),
+                         'ﺳﻠﺎﻡ')
+
+    def test_add_ligatures(self):
+        # The registered ligatures take precedence over the built-in ones
+        self.assertEqual(self.reshaper.reshape('الله'), 'ﷲ')
+        self.reshaper.add_ligatures([('الله', ('\uE300', '', '', ''))])
+        self.assertEqual(self.reshaper.reshape('الله'), '\uE300')
+        self.assertEqual(
+            self.reshaper.reshape('الله', delete_harakat=False), '\uE300'
+        )
+
+        for ligature in (('(ب)', ('ﺏ',) * 4), ('ب*', ('ﺏ',) * 4),
+                         ('ب', ('ﺏ',)), ('ACME', ('\uE100\uE101',) * 4)):
+            with self.assertRaises(ValueError):
+                self.reshaper.add_ligatures([ligature])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+from itertools import chain
+
+import arabic_reshaper
+from arabic_reshaper.letters import LETTERS_ARABIC, ISOLATED
+from arabic_reshaper.reshaper_config import with_font_config
+
+if with_font_config:
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.ttLib import TTCollection, TTFont
+
+
+def _build_font(path, characters):
+    glyph_names = ['.notdef'] + ['uni%04X' % ord(c) for c in characters]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_names)
+    builder.setupCharacterMap({
+        ord(c): name for c, name in zip(characters, glyph_names[1:])
+    })
+    builder.setupGlyf({
+        name: TTGlyphPen(None).glyph() for name in glyph_names
+    })
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyph_names})
+    builder.setupHorizontalHeader()
+    builder.setupNameTable({'familyName': 'Test', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(path)
+
+
+@unittest.skipUnless(with_font_config, 'fonttools is not installed')
+class TestFontConfiguration(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        isolated = [forms[ISOLATED] for forms in LETTERS_ARABIC.values()]
+        self.full_font = os.path.join(self.directory, 'full.ttf')
+        _build_font(self.full_font, isolated + ['ﻻ', 'ﻼ'])
+        self.partial_font = os.path.join(self.directory, 'partial.ttf')
+        _build_font(self.partial_font, [
+            forms[ISOLATED] for letter, forms in LETTERS_ARABIC.items()
+            if letter != '\u0621'
+        ])
+        self.collection = os.path.join(self.directory, 'collection.ttc')
+        collection = TTCollection()
+        collection.fonts = [TTFont(self.full_font),
+                            TTFont(self.partial_font)]
+        collection.save(self.collection)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_config_for_true_type_font(self):
+        config = arabic_reshaper.config_for_true_type_font(self.full_font)
+        self.assertFalse(config['use_unshaped_instead_of_isolated'])
+        self.assertTrue(config['ARABIC LIGATURE LAM WITH ALEF'])
+        self.assertFalse(config['ARABIC LIGATURE ALLAH'])
+
+        config = arabic_reshaper.config_for_true_type_font(self.partial_font)
+        self.assertTrue(config['use_unshaped_instead_of_isolated'])
+        self.assertFalse(config['ARABIC LIGATURE LAM WITH ALEF'])
+
+    def test_fonts_with_the_letters_of_earlier_tables(self):
+        # A font with the isolated forms of the letters the tables had
+        # before they were generated from the Unicode data, and none of the
+        # letters added since, like the join causing Tatweel variants
+        letters = [chr(code) for code in chain(
+            range(0x0621, 0x063B), range(0x0640, 0x064B),
+            (0x0671, 0x0677, 0x0679, 0x067A, 0x067B, 0x067E, 0x067F, 0x0680,
+             0x0683, 0x0684, 0x0686, 0x0687, 0x0688, 0x068C, 0x068D, 0x068E,
+             0x0691, 0x0698, 0x06A4, 0x06A6, 0x06A9, 0x06AD, 0x06AF, 0x06B1,
+             0x06B3, 0x06BA, 0x06BB, 0x06BE, 0x06C0, 0x06C1, 0x06C5, 0x06C6,
+             0x06C7, 0x06C8, 0x06C9, 0x06CB, 0x06CC, 0x06D0, 0x06D2, 0x06D3)
+        )]
+        path = os.path.join(self.directory, 'earlier.ttf')
+        _build_font(path, [LETTERS_ARABIC[letter][ISOLATED]
+                           for letter in letters])
+        config = arabic_reshaper.config_for_true_type_font(path)
+        self.assertFalse(config['use_unshaped_instead_of_isolated'])
+
+    def test_glyphs_for_true_type_font(self):
+        glyphs = arabic_reshaper.glyphs_for_true_type_font(self.partial_font)
+        self.assertNotIn(ord(LETTERS_ARABIC['\u0621'][ISOLATED]), glyphs)
+        self.assertIn(ord(LETTERS_ARABIC['\u0622'][ISOLATED]), glyphs)
+
+        reshaper = arabic_reshaper.ArabicReshaper(font_glyphs=glyphs)
+        self.assertEqual(reshaper.reshape('\u0621 \u0622'),
+                         '\u0621 ' + LETTERS_ARABIC['\u0622'][ISOLATED])
+
+    def test_configs_for_fonts(self):
+        paths = [self.full_font, self.partial_font, self.collection]
+        for workers in (1, 2):
+            configs = arabic_reshaper.configs_for_fonts(
+                paths,
+                arabic_reshaper.ENABLE_LETTERS_LIGATURES,
+                workers=workers
+            )
+            self.assertEqual(list(configs), paths)
+            self.assertEqual(configs[self.full_font], [
+                arabic_reshaper.config_for_true_type_font(
+                    self.full_font,
+                    arabic_reshaper.ENABLE_LETTERS_LIGATURES
+                )
+            ])
+            self.assertEqual(
+                configs[self.collection],
+                configs[self.full_font] + configs[self.partial_font]
+            )
+            self.assertNotIn('ARABIC LIGATURE ALLAH',
+                             configs[self.full_font][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import arabic_reshaper
+import arabic_reshaper.batch as batch
+from arabic_reshaper.letters import ZWJ, TATWEEL
+
+
+TEXTS = (
+    '',
+    'Hello, World!',
+    'السلام عليكم',
+    'السَلَاْمٌ عَلَيْكُمْ',
+    'اللغة العربية هي أكثر اللغات',
+    'تحدثاً ونطقاً ضمن مجموعة',
+    'في 18 ديسمبر كذكرى اعتماد',
+    'الأمم المتحدة، ويُحتفل',
+    'فُعِّلَ',
+    'َبسم',
+    'الله جل جلاله',
+    'محمد رسول الله صلى الله عليه وسلم',
+    'سعر المنتج ١٥٠ ريال',
+    'اللّـَهِ الرَّحْمَـٰنِ ' + TATWEEL * 3,
+    'ب' + ZWJ + 'ا' + ZWJ + 'ب',
+    'چۆمان گۆیژە',
+    'emoji 😀 سلام',
+    # NUL is also the separator of the strings when looking for ligatures
+    'a\x00b',
+    'سلام\x00',
+    '\x00لا\x00الله\x00',
+)
+
+CONFIGURATIONS = (
+    {},
+    {'delete_harakat': False},
+    {'delete_harakat': False, 'shift_harakat_position': True},
+    {'delete_harakat': False, 'support_ligatures': False},
+    {'delete_tatweel': True, 'use_unshaped_instead_of_isolated': True},
+    {'support_zwj': False, 'RIAL SIGN': True,
+     'ARABIC LIGATURE SALLALLAHOU ALAYHE WASALLAM': True,
+     'ARABIC LIGATURE JALLAJALALOUHOU': True},
+    {'language': 'Kurdish'},
+)
+
+
+class TestBatchReshaping(unittest.TestCase):
+    def check(self):
+        for i, configuration in enumerate(CONFIGURATIONS):
+            reshaper = arabic_reshaper.ArabicReshaper(configuration)
+            expected = [reshaper.reshape(text) for text in TEXTS]
+            if hasattr(self, 'subTest'):
+                with self.subTest(configuration=i):
+                    self.assertEqual(
+                        expected, arabic_reshaper.reshape_batch(TEXTS,
+                                                                reshaper)
+                    )
+            else:
+                self.assertEqual(
+                    expected, arabic_reshaper.reshape_batch(TEXTS, reshaper)
+                )
+
+    @unittest.skipUnless(batch.with_numpy, 'numpy is not installed')
+    def test_numpy(self):
+        self.check()
+
+    def test_without_numpy(self):
+        with_numpy = batch.with_numpy
+        batch.with_numpy = False
+        try:
+            self.check()
+        finally:
+            batch.with_numpy = with_numpy
+
+    def test_default_reshaper(self):
+        self.assertEqual(arabic_reshaper.reshape_batch(TEXTS),
+                         [arabic_reshaper.reshape(text) for text in TEXTS])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import arabic_reshaper
+import arabic_reshaper.columns as columns
+
+if columns.with_pandas:
+    import pandas as pd
+
+if columns.with_pyarrow:
+    import pyarrow as pa
+
+
+VALUES = ['دمشق', None, 'بغداد', 'دمشق', 'Paris', 'بغداد', 'الله']
+
+
+@unittest.skipUnless(columns.with_pandas, 'pandas is not installed')
+class TestSeriesReshaping(unittest.TestCase):
+    def expected(self, reshaper=arabic_reshaper.default_reshaper):
+        return [
+            None if value is None else reshaper.reshape(value)
+            for value in VALUES
+        ]
+
+    def check(self, series, reshaper=None):
+        reshaped = arabic_reshaper.reshape_series(series, reshaper)
+        self.assertEqual(list(reshaped.index), list(series.index))
+        self.assertEqual(reshaped.name, series.name)
+        self.assertEqual(
+            [None if pd.isna(value) else value for value in reshaped],
+            self.expected(reshaper or arabic_reshaper.default_reshaper)
+        )
+
+    def test_object_series(self):
+        self.check(pd.Series(VALUES, index=list('abcdefg'), name='city'))
+
+    def test_categorical_series(self):
+        self.check(pd.Series(VALUES, dtype='category'))
+
+    def test_configured_reshaper(self):
+        reshaper = arabic_reshaper.ArabicReshaper({
+            'support_ligatures': False
+        })
+        self.check(pd.Series(VALUES), reshaper)
+
+    def test_without_pyarrow(self):
+        with_pyarrow = columns.with_pyarrow
+        columns.with_pyarrow = False
+        try:
+            self.check(pd.Series(VALUES))
+        finally:
+            columns.with_pyarrow = with_pyarrow
+
+
+@unittest.skipUnless(columns.with_pyarrow, 'pyarrow is not installed')
+class TestArrowReshaping(unittest.TestCase):
+    def setUp(self):
+        self.expected = [
+            None if value is None else arabic_reshaper.reshape(value)
+            for value in VALUES
+        ]
+
+    def test_array(self):
+        reshaped = arabic_reshaper.reshape_arrow(pa.array(VALUES))
+        self.assertEqual(reshaped.type, pa.string())
+        self.assertEqual(reshaped.to_pylist(), self.expected)
+
+    def test_large_string_array(self):
+        reshaped = arabic_reshaper.reshape_arrow(
+            pa.array(VALUES, type=pa.large_string())
+        )
+        self.assertEqual(reshaped.type, pa.large_string())
+        self.assertEqual(reshaped.to_pylist(), self.expected)
+
+    def test_dictionary_array(self):
+        reshaped = arabic_reshaper.reshape_arrow(
+            pa.array(VALUES).dictionary_encode()
+        )
+        self.assertEqual(reshaped.to_pylist(), self.expected)
+
+    def test_chunked_array(self):
+        reshaped = arabic_reshaper.reshape_arrow(
+            pa.chunked_array([VALUES[:3], VALUES[3:]])
+        )
+        self.assertEqual(reshaped.num_chunks, 2)
+        self.assertEqual(reshaped.to_pylist(), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
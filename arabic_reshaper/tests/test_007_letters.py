@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import runpy
+import unittest
+
+import arabic_reshaper
+from arabic_reshaper.letters import (ISOLATED, INITIAL, MEDIAL, FINAL,
+                                     TATWEEL, ZWJ, LETTERS_ARABIC,
+                                     LETTERS_ARABIC_V2, LETTERS_KURDISH,
+                                     joining_type, presentation_forms,
+                                     letters_from_unicode)
+
+GENERATOR = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                         'tools', 'generate_joining_data.py')
+
+
+class TestLetters(unittest.TestCase):
+    def test_joining_type(self):
+        cases = (
+            ('ب', 'D'),  # ARABIC LETTER BEH
+            ('ا', 'R'),  # ARABIC LETTER ALEF
+            ('ء', 'U'),  # ARABIC LETTER HAMZA
+            ('ݢ', 'D'),  # ARABIC LETTER KEHEH WITH DOT ABOVE
+            ('َ', 'T'),  # ARABIC FATHA
+            (TATWEEL, 'C'),
+            (ZWJ, 'C'),
+            ('a', 'U'),
+            ('\U0001F600', 'U'),
+        )
+        for letter, expected in cases:
+            self.assertEqual(joining_type(letter), expected)
+
+    def test_presentation_forms(self):
+        self.assertEqual(presentation_forms('ب'),
+                         ('ﺏ', 'ﺑ', 'ﺒ', 'ﺐ'))
+        self.assertEqual(presentation_forms('ا'),
+                         ('ﺍ', '', '', 'ﺎ'))
+        self.assertEqual(presentation_forms('ݢ'), ('', '', '', ''))
+        self.assertEqual(presentation_forms('a'), ('', '', '', ''))
+
+    def test_tables(self):
+        self.assertEqual(LETTERS_ARABIC['ب'],
+                         ('ﺏ', 'ﺑ', 'ﺒ', 'ﺐ'))
+        self.assertEqual(LETTERS_ARABIC_V2['ب'],
+                         ('ب', 'ﺑ', 'ﺒ', 'ﺐ'))
+        self.assertEqual(LETTERS_ARABIC[TATWEEL], (TATWEEL,) * 4)
+        self.assertEqual(LETTERS_ARABIC[ZWJ], (ZWJ,) * 4)
+        self.assertEqual(LETTERS_ARABIC['ݢ'], ('ݢ', '', '', ''))
+        self.assertNotIn('َ', LETTERS_ARABIC)
+
+        # The Private Use Area glyphs of the Kurdish letters
+        self.assertEqual(LETTERS_KURDISH['ێ'],
+                         ('\uE004', '\uE005', '\uE006', '\uE004'))
+        self.assertEqual(LETTERS_KURDISH['ە'],
+                         ('ە', '', '', '\uE000'))
+        self.assertEqual(LETTERS_KURDISH['ه'], ('ﮫ',) * 4)
+
+    def test_overrides(self):
+        letters = letters_from_unicode(overrides={
+            'ݢ': ('\uE010', '\uE011', '\uE012', '\uE013'),
+        })
+        self.assertEqual(letters['ݢ'][INITIAL], '\uE011')
+        self.assertEqual(letters['ب'], LETTERS_ARABIC['ب'])
+
+    def test_letters_without_presentation_forms(self):
+        # They are left as they are, and the letters around them don't
+        # connect to them
+        self.assertEqual(arabic_reshaper.reshape('بݢب'),
+                         'ﺏݢﺏ')
+        self.assertEqual(
+            arabic_reshaper.reshape('ببݢ'),
+            LETTERS_ARABIC['ب'][INITIAL] +
+            LETTERS_ARABIC['ب'][FINAL] + 'ݢ'
+        )
+        self.assertEqual(
+            arabic_reshaper.reshape('ببب'),
+            LETTERS_ARABIC['ب'][INITIAL] +
+            LETTERS_ARABIC['ب'][MEDIAL] +
+            LETTERS_ARABIC['ب'][FINAL]
+        )
+        self.assertEqual(arabic_reshaper.reshape('ب'),
+                         LETTERS_ARABIC['ب'][ISOLATED])
+
+    @unittest.skipUnless(os.path.exists(GENERATOR),
+                         'tools/generate_joining_data.py is not available')
+    def test_joining_data_is_up_to_date(self):
+        generator = runpy.run_path(GENERATOR)
+        with io.open(generator['OUTPUT'], 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), generator['generate']())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+
+import arabic_reshaper
+from arabic_reshaper.shared_cache import with_shared_memory
+
+
+def reshape_in_child(name, texts):
+    cache = arabic_reshaper.SharedResultCache(name)
+    reshaper = arabic_reshaper.ArabicReshaper(cache=cache)
+    for text in texts:
+        reshaper.reshape(text)
+    cache.close()
+
+
+@unittest.skipUnless(with_shared_memory,
+                     'multiprocessing.shared_memory is not available')
+class TestSharedResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = arabic_reshaper.SharedResultCache(slots=64,
+                                                       arena_size=4096)
+
+    def tearDown(self):
+        self.cache.close()
+        self.cache.unlink()
+
+    def test_get_and_set(self):
+        self.assertIsNone(self.cache.get(b'key'))
+        self.cache.set(b'key', 'ﺍﻟﺴﻼﻡ')
+        self.assertEqual(self.cache.get(b'key'), 'ﺍﻟﺴﻼﻡ')
+        self.cache.set(b'key', 'ﻋﻠﻴﻜﻢ')
+        self.assertEqual(self.cache.get(b'key'), 'ﻋﻠﻴﻜﻢ')
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(b'key'))
+
+    def test_eviction(self):
+        # The arena only holds the latest entries, the older ones are
+        # missed, never mixed up
+        for i in range(1000):
+            self.cache.set(str(i).encode(), 'value {}'.format(i))
+        values = [self.cache.get(str(i).encode()) for i in range(1000)]
+        for i, value in enumerate(values):
+            self.assertIn(value, (None, 'value {}'.format(i)))
+        self.assertEqual(values[-1], 'value 999')
+        self.assertIsNone(values[0])
+
+    def test_reshaper(self):
+        reshaper = arabic_reshaper.ArabicReshaper(cache=self.cache)
+        text = 'السلام عليكم'
+        expected = arabic_reshaper.reshape(text)
+        self.assertEqual(reshaper.reshape(text), expected)
+        key = reshaper._configuration_digest + text.encode('utf-8')
+        self.assertEqual(self.cache.get(key), expected)
+        self.assertEqual(reshaper.reshape(text), expected)
+
+        # Other configurations don't get these entries
+        self.assertEqual(reshaper.reshape(text, delete_harakat=False),
+                         expected)
+        self.assertEqual(reshaper.reshape(text, support_ligatures=False),
+                         arabic_reshaper.reshape(text,
+                                                 support_ligatures=False))
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        'fork start method is not available'
+    )
+    def test_processes(self):
+        texts = ['السلام عليكم', 'مرحبا', 'اللغة العربية']
+        process = multiprocessing.get_context('fork').Process(
+            target=reshape_in_child, args=(self.cache.name, texts)
+        )
+        process.start()
+        process.join()
+        self.assertEqual(process.exitcode, 0)
+
+        prefix = arabic_reshaper.default_reshaper._configuration_digest
+        for text in texts:
+            self.assertEqual(self.cache.get(prefix + text.encode('utf-8')),
+                             arabic_reshaper.reshape(text))
+
+    def test_with_statement(self):
+        with arabic_reshaper.SharedResultCache(self.cache.name) as cache:
+            cache.set(b'key', 'ﺍﻟﺴﻼﻡ')
+        self.assertIsNone(cache._memory.buf)
+        self.assertEqual(self.cache.get(b'key'), 'ﺍﻟﺴﻼﻡ')
+
+    def test_exit_without_closing(self):
+        # The caches are closed and the blocks created are removed when the
+        # process exits, without any error or warning
+        package = os.path.dirname(os.path.dirname(arabic_reshaper.__file__))
+        code = (
+            'import arabic_reshaper\n'
+            'cache = arabic_reshaper.SharedResultCache(slots=64, '
+            'arena_size=4096)\n'
+            'arabic_reshaper.SharedResultCache({!r}).set(b"key", "value")\n'
+            'print(cache.name)\n'
+        ).format(self.cache.name)
+        process = subprocess.run(
+            [sys.executable, '-c', code], stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, universal_newlines=True,
+            env=dict(os.environ, PYTHONPATH=package)
+        )
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(process.stderr, '')
+        self.assertEqual(self.cache.get(b'key'), 'value')
+        from multiprocessing.shared_memory import SharedMemory
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(process.stdout.strip())
+
+
+if __name__ == '__main__':
+    unittest.main()
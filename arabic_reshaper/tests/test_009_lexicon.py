@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import arabic_reshaper
+from arabic_reshaper.lexicon import read_lexicon
+
+CORPUS = [
+    'السلام عليكم ورحمة الله',
+    'مرحبا بكم في الموقع',
+    'السلام عليكم',
+    'صلى الله عليه وسلم',
+    'hello مرحبا',
+]
+
+
+class TestLexicon(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'lexicon.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_build_and_load(self):
+        lexicon = arabic_reshaper.build_lexicon(CORPUS, self.path, size=3)
+        self.assertEqual(len(lexicon), 3)
+        self.assertEqual(lexicon['السلام'],
+                         arabic_reshaper.reshape('السلام'))
+        digest, words = read_lexicon(self.path)
+        self.assertEqual(words, lexicon)
+        self.assertEqual(
+            digest, arabic_reshaper.default_reshaper._configuration_digest
+        )
+
+        reshaper = arabic_reshaper.ArabicReshaper(lexicon=self.path)
+        texts = CORPUS + [
+            'السلام عليكم يا صديقي',
+            # A haraka after the space attaches to the character before it
+            'السلام ًعليكم',
+            # ZWJ and Harakat before the space
+            'السلا‍م‍ً عليكم',
+            'السلام\nعليكم\n',
+        ]
+        for text in texts:
+            self.assertEqual(reshaper.reshape(text),
+                             arabic_reshaper.reshape(text))
+
+    def test_sentence_ligatures(self):
+        # The words of the sentence ligatures are not reshaped one by one
+        configuration = {'ARABIC LIGATURE SALLALLAHOU ALAYHE WASALLAM': True}
+        reshaper = arabic_reshaper.ArabicReshaper(configuration)
+        arabic_reshaper.build_lexicon(CORPUS, self.path, reshaper)
+        reshaper = arabic_reshaper.ArabicReshaper(configuration,
+                                                  lexicon=self.path)
+        self.assertEqual(reshaper.reshape('صلى الله عليه وسلم'), '\uFDFA')
+
+    def test_other_configuration(self):
+        arabic_reshaper.build_lexicon(CORPUS, self.path)
+        with self.assertRaises(ValueError):
+            arabic_reshaper.ArabicReshaper({'delete_harakat': False},
+                                           lexicon=self.path)
+
+    def test_add_ligatures_drops_lexicon(self):
+        arabic_reshaper.build_lexicon(CORPUS, self.path)
+        reshaper = arabic_reshaper.ArabicReshaper(lexicon=self.path)
+        reshaper.add_ligatures([('السلام', ('', '', '', ''))])
+        self.assertEqual(reshaper.reshape('السلام عليكم'),
+                         ' ' + arabic_reshaper.reshape('عليكم'))
+
+
+if __name__ == '__main__':
+    unittest.main()
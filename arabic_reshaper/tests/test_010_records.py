@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import arabic_reshaper
+from arabic_reshaper.__main__ import main
+
+CSV = (
+    'id,name,note\r\n'
+    '1,محمد,"hello, world"\r\n'
+    '"2",Ali,"multi\nline سلام"\r\n'
+    '3,"سلام عليكم",ok\r\n'
+).encode('utf-8')
+
+EXPECTED_CSV = (
+    'id,name,note\r\n'
+    '1,ﻣﺤﻤﺪ,"hello, world"\r\n'
+    '"2",Ali,"multi\nline سلام"\r\n'
+    '3,"ﺳﻼﻡ ﻋﻠﻴﻜﻢ",ok\r\n'
+).encode('utf-8')
+
+JSONL = (
+    '{"id": 1, "user": {"name": "محمد"}, "tags": ["سلام", 1]}\n'
+    '{"id": 2, "user": {"name": "Ali"}, "note": "سلام"}\n'
+    '\n'
+    '{"items": [{"t": "\\u0633\\u0644\\u0627\\u0645"}, {"t": null}]}'
+).encode('utf-8')
+
+EXPECTED_JSONL = (
+    '{"id": 1, "user": {"name": "ﻣﺤﻤﺪ"}, "tags": ["ﺳﻼﻡ", 1]}\n'
+    '{"id": 2, "user": {"name": "Ali"}, "note": "سلام"}\n'
+    '\n'
+    '{"items": [{"t": "ﺳﻼﻡ"}, {"t": null}]}'
+).encode('utf-8')
+
+
+class TestRecords(unittest.TestCase):
+    def test_reshape_csv(self):
+        # The rows that don't change are copied as they were read
+        for columns in (['name'], [1]):
+            output = io.BytesIO()
+            self.assertEqual(
+                arabic_reshaper.reshape_csv(io.BytesIO(CSV), output, columns,
+                                            header=True),
+                3
+            )
+            self.assertEqual(output.getvalue(), EXPECTED_CSV)
+
+    def test_reshape_csv_keeps_other_fields(self):
+        # Only the reshaped fields are written again, with the quoting they
+        # had, the other fields are left as they were
+        cases = (
+            ('"1","سلام","x"\n', '"1","ﺳﻼﻡ","x"\n'),
+            ('1 , سلام,"x""y"\r\n', '1 , ﺳﻼﻡ,"x""y"\r\n'),
+            ('1,"سلام ""ب""",x\n', '1,"ﺳﻼﻡ ""ﺏ""",x\n'),
+            ('"\n"  ,لا, ,\n', '"\n"  ,ﻻ, ,\n'),
+            # Fields that become empty, a row with a single empty field
+            # has to be quoted
+            ('َ,َ\n"َ"\nَ\n', ',\n""\n""\n'),
+        )
+        for data, expected in cases:
+            output = io.BytesIO()
+            arabic_reshaper.reshape_csv(io.BytesIO(data.encode('utf-8')),
+                                        output, [0, 1])
+            self.assertEqual(output.getvalue().decode('utf-8'), expected)
+
+    def test_reshape_csv_dialect(self):
+        output = io.BytesIO()
+        arabic_reshaper.reshape_csv(
+            io.BytesIO('سلام;x\n'.encode('utf-8')), output, [0],
+            delimiter=';'
+        )
+        self.assertEqual(output.getvalue(), 'ﺳﻼﻡ;x\n'.encode('utf-8'))
+
+    def test_reshape_jsonl(self):
+        output = io.BytesIO()
+        self.assertEqual(
+            arabic_reshaper.reshape_jsonl(io.BytesIO(JSONL), output,
+                                          ['user.name', 'tags', 'items.t']),
+            4
+        )
+        self.assertEqual(output.getvalue(), EXPECTED_JSONL)
+        for line in output.getvalue().splitlines():
+            if line:
+                json.loads(line.decode('utf-8'))
+
+    def test_reshape_jsonl_keeps_other_values(self):
+        # Only the reshaped strings are written again, the numbers and
+        # escapes of the other fields are left as they were
+        line = ('{"a":1.0e10,"b":0.30000000000000004,"c":"\\u00e9",'
+                '"name":"سلام","d":[1E2,{"name":"x"}]}\r\n')
+        output = io.BytesIO()
+        arabic_reshaper.reshape_jsonl(io.BytesIO(line.encode('utf-8')),
+                                      output, ['name', 'd.name'])
+        self.assertEqual(output.getvalue().decode('utf-8'),
+                         line.replace('سلام', 'ﺳﻼﻡ'))
+
+    def test_reshape_jsonl_invalid(self):
+        for line in ('{"name": "سلام"', '{"name" "سلام"}',
+                     '{"name": "سلام"} x', '[1, "سلام",]'):
+            with self.assertRaises(ValueError):
+                arabic_reshaper.reshape_jsonl(
+                    io.BytesIO(line.encode('utf-8')), io.BytesIO(), ['name']
+                )
+
+    def test_workers(self):
+        csv_data = CSV * 50
+        output = io.BytesIO()
+        arabic_reshaper.reshape_csv(io.BytesIO(csv_data), output, [1])
+        expected = output.getvalue()
+        output = io.BytesIO()
+        arabic_reshaper.reshape_csv(io.BytesIO(csv_data), output, [1],
+                                    workers=2, batch_size=7)
+        self.assertEqual(output.getvalue(), expected)
+
+        jsonl_data = (JSONL + b'\n') * 50
+        output = io.BytesIO()
+        arabic_reshaper.reshape_jsonl(io.BytesIO(jsonl_data), output,
+                                      ['user.name'], workers=2, batch_size=7)
+        expected = io.BytesIO()
+        arabic_reshaper.reshape_jsonl(io.BytesIO(jsonl_data), expected,
+                                      ['user.name'])
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_command_line(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'records')
+            with open(path, 'wb') as f:
+                f.write(CSV)
+            main(['csv', '--columns', 'name', path, '-o', path + '.out'])
+            with open(path + '.out', 'rb') as f:
+                self.assertEqual(f.read(), EXPECTED_CSV)
+
+            with open(path, 'wb') as f:
+                f.write(JSONL)
+            main(['jsonl', '--paths', 'user.name,tags,items.t', path,
+                  '-o', path + '.out'])
+            with open(path + '.out', 'rb') as f:
+                self.assertEqual(f.read(), EXPECTED_JSONL)
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
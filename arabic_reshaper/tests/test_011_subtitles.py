@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import arabic_reshaper
+from arabic_reshaper.__main__ import main
+
+SRT = (
+    '\ufeff1\r\n'
+    '00:00:01,000 --> 00:00:02,500\r\n'
+    '<i>سلام</i> عليكم\r\n'
+    '{\\an8}محمد\r\n'
+    '\r\n'
+    '2\r\n'
+    '00:00:03,000 --> 00:00:04,000\r\n'
+    'بال<font color="red">عربي</font>\r\n'
+).encode('utf-8')
+
+EXPECTED_SRT = (
+    '\ufeff1\r\n'
+    '00:00:01,000 --> 00:00:02,500\r\n'
+    '<i>ﺳﻼﻡ</i> ﻋﻠﻴﻜﻢ\r\n'
+    '{\\an8}ﻣﺤﻤﺪ\r\n'
+    '\r\n'
+    '2\r\n'
+    '00:00:03,000 --> 00:00:04,000\r\n'
+    'ﺑﺎﻟ<font color="red">ﻌﺮﺑﻲ</font>\r\n'
+).encode('utf-8')
+
+VTT = (
+    'WEBVTT - عربي\n'
+    '\n'
+    'NOTE محمد\n'
+    '\n'
+    'تحية\n'
+    '00:01.000 --> 00:02.000 align:start\n'
+    '<v محمد>سلام <00:01.500><c.yellow>عليكم</c>\n'
+).encode('utf-8')
+
+EXPECTED_VTT = (
+    'WEBVTT - عربي\n'
+    '\n'
+    'NOTE محمد\n'
+    '\n'
+    'تحية\n'
+    '00:01.000 --> 00:02.000 align:start\n'
+    '<v محمد>ﺳﻼﻡ <00:01.500><c.yellow>ﻋﻠﻴﻜﻢ</c>\n'
+).encode('utf-8')
+
+
+class TestSubtitles(unittest.TestCase):
+    def test_reshape_subtitles(self):
+        for data, expected, count in ((SRT, EXPECTED_SRT, 2),
+                                      (VTT, EXPECTED_VTT, 1)):
+            for batch_size in (1, 100):
+                output = io.BytesIO()
+                self.assertEqual(
+                    arabic_reshaper.reshape_subtitles(
+                        io.BytesIO(data), output, batch_size=batch_size
+                    ),
+                    count
+                )
+                self.assertEqual(output.getvalue(), expected)
+
+    def test_files(self):
+        directory = tempfile.mkdtemp()
+        try:
+            files = []
+            for i, data in enumerate((SRT, VTT, SRT)):
+                path = os.path.join(directory, '{}.sub'.format(i))
+                with open(path, 'wb') as f:
+                    f.write(data)
+                files.append((path, path + '.out'))
+            for workers in (1, 2):
+                self.assertEqual(
+                    arabic_reshaper.reshape_subtitle_files(files,
+                                                           workers=workers),
+                    [2, 1, 2]
+                )
+                for (_, path), expected in zip(
+                        files, (EXPECTED_SRT, EXPECTED_VTT, EXPECTED_SRT)):
+                    with open(path, 'rb') as f:
+                        self.assertEqual(f.read(), expected)
+                    os.remove(path)
+
+            main(['subtitles', files[0][0], files[1][0], '-o',
+                  os.path.join(directory, 'out')])
+            with open(os.path.join(directory, 'out', '1.sub'), 'rb') as f:
+                self.assertEqual(f.read(), EXPECTED_VTT)
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import gettext
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import arabic_reshaper
+from arabic_reshaper.__main__ import main
+
+PO = '''# Arabic translations
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=CP1256\\n"
+"Plural-Forms: nplurals=2; plural=(n != 1);\\n"
+
+#: app.py:1
+msgid "Hello %(name)s"
+msgstr "مرحبا %(name)s"
+
+msgctxt "menu"
+msgid "File"
+msgstr "ملف"
+
+msgid "%d file"
+msgid_plural "%d files"
+msgstr[0] "%d ملف"
+msgstr[1] "%d "
+"ملفات"
+
+msgid "{count} messages from {name}"
+msgstr "{count} رسائل من{name}"
+
+#, fuzzy
+msgid "Fuzzy"
+msgstr "غامض"
+
+msgid "Untranslated"
+msgstr ""
+
+#~ msgid "Obsolete"
+#~ msgstr "قديم"
+'''.encode('cp1256')
+
+
+class TestCatalogs(unittest.TestCase):
+    def check_catalog(self, data):
+        translations = gettext.GNUTranslations(io.BytesIO(data))
+        self.assertEqual(translations.gettext('Hello %(name)s'),
+                         'ﻣﺮﺣﺒﺎ %(name)s')
+        self.assertEqual(translations.ngettext('%d file', '%d files', 1),
+                         '%d ﻣﻠﻒ')
+        self.assertEqual(translations.ngettext('%d file', '%d files', 2),
+                         '%d ﻣﻠﻔﺎﺕ')
+        self.assertEqual(translations.gettext('{count} messages from {name}'),
+                         '{count} ﺭﺳﺎﺋﻞ ﻣﻦ{name}')
+        self.assertEqual(translations.gettext('Fuzzy'), 'Fuzzy')
+        self.assertEqual(translations.gettext('Untranslated'), 'Untranslated')
+        self.assertEqual(translations.gettext('Obsolete'), 'Obsolete')
+        self.assertEqual(translations.info()['content-type'],
+                         'text/plain; charset=UTF-8')
+        if hasattr(translations, 'pgettext'):
+            self.assertEqual(translations.pgettext('menu', 'File'), 'ﻣﻠﻒ')
+
+    def test_reshape_catalog(self):
+        output = io.BytesIO()
+        self.assertEqual(
+            arabic_reshaper.reshape_catalog(io.BytesIO(PO), output), 4
+        )
+        self.check_catalog(output.getvalue())
+
+        # Compiled catalogs can be reshaped too
+        mo = output.getvalue()
+        output = io.BytesIO()
+        self.assertEqual(
+            arabic_reshaper.reshape_catalog(io.BytesIO(mo), output), 4
+        )
+        self.assertEqual(output.getvalue(), mo)
+
+    def test_syntax_error(self):
+        with self.assertRaises(ValueError):
+            arabic_reshaper.reshape_catalog(
+                io.BytesIO(b'msgid "a"\nmsgstr b\n'), io.BytesIO()
+            )
+
+    def test_command_line(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'messages.po')
+            with open(path, 'wb') as f:
+                f.write(PO)
+            main(['catalog', path, '-o', path[:-2] + 'mo'])
+            with open(path[:-2] + 'mo', 'rb') as f:
+                self.check_catalog(f.read())
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import sqlite3
+import sys
+import unittest
+
+import arabic_reshaper
+
+
+class TestSQLite(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.execute('CREATE TABLE cities (id, name)')
+        self.connection.executemany(
+            'INSERT INTO cities VALUES (?, ?)',
+            [(1, 'دمشق'), (2, 'الله'), (3, None), (4, 42), (5, 'Paris')]
+        )
+
+    def tearDown(self):
+        self.connection.close()
+
+    def names(self):
+        return [name for name, in self.connection.execute(
+            'SELECT name FROM cities ORDER BY id'
+        )]
+
+    def test_functions(self):
+        for cache_size in (None, 16):
+            arabic_reshaper.register_sqlite_functions(self.connection,
+                                                      cache_size=cache_size)
+            self.assertEqual(
+                [name for name, in self.connection.execute(
+                    'SELECT reshape(name) FROM cities ORDER BY id'
+                )],
+                ['ﺩﻣﺸﻖ', 'ﷲ', None, 42, 'Paris']
+            )
+
+        self.connection.execute('UPDATE cities SET name = reshape(name)')
+        self.assertEqual(self.names(), ['ﺩﻣﺸﻖ', 'ﷲ', None, 42, 'Paris'])
+        self.connection.execute('UPDATE cities SET name = unreshape(name)')
+        self.assertEqual(self.names(), ['دمشق', 'الله', None, 42, 'Paris'])
+
+    def test_reshaper(self):
+        reshaper = arabic_reshaper.ArabicReshaper({
+            'ARABIC LIGATURE ALLAH': False
+        })
+        arabic_reshaper.register_sqlite_functions(self.connection, reshaper)
+        self.assertEqual(
+            self.connection.execute(
+                'SELECT reshape(name) FROM cities WHERE id = 2'
+            ).fetchone(),
+            ('ﺍﻟﻠﻪ',)
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 8) or
+                     sqlite3.sqlite_version_info < (3, 8, 3),
+                     'deterministic functions are not supported')
+    def test_index(self):
+        # Only deterministic functions can be used in indexes
+        arabic_reshaper.register_sqlite_functions(self.connection)
+        self.connection.execute(
+            'CREATE INDEX shaped_names ON cities (reshape(name))'
+        )
+        self.assertEqual(
+            self.connection.execute(
+                "SELECT id FROM cities WHERE reshape(name) = 'ﺩﻣﺸﻖ'"
+            ).fetchall(),
+            [(1,)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
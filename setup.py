@@ -20,7 +20,8 @@ setup(
     license='MIT',
     packages=['arabic_reshaper'],
     extras_require={
-        'with-fonttools': ['fonttools>=4.0']
+        'with-fonttools': ['fonttools>=4.0'],
+        'with-numpy': ['numpy'],
     },
     author='Abdullah Diab',
     author_email='mpcabd@gmail.com',
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Benchmarks `reshape_parallel` on one large text against `reshape`, with an
+# increasing number of worker processes, and checks the results are the same.
+#
+#   $ python tools/benchmark_parallel.py [megabytes] [max workers]
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arabic_reshaper  # noqa: E402
+
+WORDS = ('السلام عليكم مرحبا بكم في الموقع الرئيسي للشركة اللغة العربية '
+         'تسجيل الدخول الخروج الصفحة التالية السابقة بحث إعدادات حساب '
+         'المستخدم كلمة المرور نسيت رسالة جديدة حذف تعديل حفظ إلغاء').split()
+
+
+def make_text(megabytes):
+    rng = random.Random(0)
+    lines = []
+    size = 0
+    while size < megabytes << 20:
+        line = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 20)))
+        lines.append(line + '.')
+        size += len(line.encode('utf-8')) + 2
+    return '\n'.join(lines)
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    max_workers = (int(sys.argv[2]) if len(sys.argv) > 2
+                   else multiprocessing.cpu_count())
+
+    text = make_text(megabytes)
+    print('{} characters, {} CPUs'.format(len(text),
+                                          multiprocessing.cpu_count()))
+
+    began = time.perf_counter()
+    expected = arabic_reshaper.reshape(text)
+    sequential = time.perf_counter() - began
+    print('reshape            {:.2f}s'.format(sequential))
+
+    workers = 1
+    while workers <= max_workers:
+        began = time.perf_counter()
+        result = arabic_reshaper.reshape_parallel(text, workers)
+        elapsed = time.perf_counter() - began
+        print('{:2} workers         {:.2f}s  x{:.2f}{}'.format(
+            workers, elapsed, sequential / elapsed,
+            '' if result == expected else '  DIFFERENT RESULT'
+        ))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
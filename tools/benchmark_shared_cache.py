@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Benchmarks SharedResultCache with a local multi-process harness: worker
+# processes reshape the same labels, like the workers of a web server, with no
+# cache, with a cache of their own, or with one cache they all share. The
+# time of each pass shows how fast the workers get warm, the first pass of a
+# worker that starts late shows what a new worker pays.
+#
+#   $ python tools/benchmark_shared_cache.py [workers] [labels] [passes]
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arabic_reshaper  # noqa: E402
+
+WORDS = ('السلام عليكم مرحبا بكم في الموقع الرئيسي للشركة اللغة العربية '
+         'تسجيل الدخول الخروج الصفحة التالية السابقة بحث إعدادات حساب '
+         'المستخدم كلمة المرور نسيت رسالة جديدة حذف تعديل حفظ إلغاء').split()
+
+
+class DictCache(object):
+    # A cache of the worker's own, with the same interface
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        self._entries[key] = value
+
+
+def make_labels(count):
+    rng = random.Random(0)
+    return [' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+            for _ in range(count)]
+
+
+def worker(cache, labels, passes, start, results):
+    start.wait()
+    if cache == 'private':
+        cache = DictCache()
+    reshaper = arabic_reshaper.ArabicReshaper(cache=cache)
+    labels = list(labels)
+    random.Random(os.getpid()).shuffle(labels)
+    timings = []
+    for _ in range(passes):
+        began = time.perf_counter()
+        for label in labels:
+            reshaper.reshape(label)
+        timings.append(time.perf_counter() - began)
+    results.put(timings)
+
+
+def run(mode, workers, labels, passes):
+    context = multiprocessing.get_context('fork')
+    cache = None
+    if mode == 'shared':
+        cache = arabic_reshaper.SharedResultCache(slots=1 << 17,
+                                                  arena_size=32 << 20)
+    elif mode == 'private':
+        cache = 'private'
+    start = context.Event()
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker,
+                        args=(cache, labels, passes, start, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    timings = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    # A worker started once the others are done
+    late = context.Process(target=worker,
+                           args=(cache, labels, 1, start, results))
+    late.start()
+    late_timing = results.get()[0]
+    late.join()
+
+    if mode == 'shared':
+        cache.close()
+        cache.unlink()
+
+    per_pass = [max(timing[i] for timing in timings) for i in range(passes)]
+    print('{:8} {}  late worker {:.3f}s'.format(
+        mode, ' '.join('{:.3f}s'.format(t) for t in per_pass), late_timing
+    ))
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    passes = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    # Each worker reshapes the labels in its own order, like the requests a
+    # server's workers get
+    labels = make_labels(count)
+    print('{} workers, {} labels ({} distinct), slowest worker per pass'
+          .format(workers, count, len(set(labels))))
+    for mode in ('none', 'private', 'shared'):
+        run(mode, workers, labels, passes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Builds a lexicon of the most frequent words of a corpus with their shapes,
+# see `arabic_reshaper.build_lexicon`:
+#
+#   $ python tools/build_lexicon.py corpus.txt [more.txt ...] -o lexicon.txt \
+#         [--size 10000] [--configuration-file config.ini]
+
+import argparse
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arabic_reshaper  # noqa: E402
+
+
+def lines(paths):
+    for path in paths:
+        with io.open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield line
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build a lexicon of the most frequent words of a corpus.'
+    )
+    parser.add_argument('corpus', nargs='+', help='UTF-8 text files')
+    parser.add_argument('-o', '--output', required=True,
+                        help='path of the lexicon')
+    parser.add_argument('--size', type=int, default=10000,
+                        help='number of words to keep')
+    parser.add_argument('--configuration-file',
+                        help='configuration of the reshaper')
+    args = parser.parse_args()
+
+    reshaper = arabic_reshaper.ArabicReshaper(
+        configuration_file=args.configuration_file
+    )
+    lexicon = arabic_reshaper.build_lexicon(lines(args.corpus), args.output,
+                                            reshaper, args.size)
+    print('{} words written to {}'.format(len(lexicon), args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This work is licensed under the MIT License.
+# To view a copy of this license, visit https://opensource.org/licenses/MIT
+
+# Generates arabic_reshaper/joining_data.py, the joining types and the
+# presentation forms of the Arabic script letters, from the Unicode Character
+# Database files in tools/ucd.
+#
+# To update to a newer version of Unicode, replace the files in tools/ucd
+# with the ones of that version (extracted/DerivedJoiningType.txt and
+# UnicodeData.txt) and rerun:
+#
+#   $ python tools/generate_joining_data.py
+
+import io
+import os
+import re
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+UCD_DIR = os.path.join(TOOLS_DIR, 'ucd')
+OUTPUT = os.path.join(os.path.dirname(TOOLS_DIR), 'arabic_reshaper',
+                      'joining_data.py')
+
+# The Arabic script blocks, and the only joiner the reshaper supports
+BLOCKS = (
+    (0x0600, 0x06FF),  # Arabic
+    (0x0750, 0x077F),  # Arabic Supplement
+    (0x0870, 0x089F),  # Arabic Extended-B
+    (0x08A0, 0x08FF),  # Arabic Extended-A
+    (0x200D, 0x200D),  # ZERO WIDTH JOINER
+)
+
+FORMS = ('<isolated>', '<initial>', '<medial>', '<final>')
+
+HEADER = '''\
+# -*- coding: utf-8 -*-
+
+# This file is generated by tools/generate_joining_data.py from the Unicode
+# Character Database, don't edit it, rerun the generator instead.
+#
+# JOINING_TYPES and PRESENTATION_FORMS are tuples of (first codepoint, table)
+# where the table holds the data of consecutive codepoints: one joining type
+# per codepoint, D (dual joining), R (right joining), L (left joining),
+# C (join causing), T (transparent) or U (non joining), and four presentation
+# forms per codepoint, isolated, initial, medial and final, '\\x00' when
+# Unicode has no presentation form.
+'''
+
+
+def read_ucd(name):
+    with io.open(os.path.join(UCD_DIR, name), 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                yield [field.strip() for field in line.split(';')]
+
+
+def read_joining_types():
+    joining_types = {}
+    for code_range, joining_type in read_ucd('DerivedJoiningType.txt'):
+        first, _, last = code_range.partition('..')
+        for code in range(int(first, 16), int(last or first, 16) + 1):
+            joining_types[code] = joining_type
+    return joining_types
+
+
+def read_unicode_data():
+    names = {}
+    presentation_forms = {}
+    for fields in read_ucd('UnicodeData.txt'):
+        code = int(fields[0], 16)
+        names[code] = fields[1]
+        decomposition = fields[5].split()
+        if len(decomposition) == 2 and decomposition[0] in FORMS:
+            forms = presentation_forms.setdefault(int(decomposition[1], 16),
+                                                  ['\x00'] * len(FORMS))
+            forms[FORMS.index(decomposition[0])] = chr(code)
+    return names, presentation_forms
+
+
+def segments(codes):
+    # Split sorted codepoints into runs of consecutive ones
+    runs = []
+    for code in codes:
+        if runs and runs[-1][-1] == code - 1:
+            runs[-1].append(code)
+        else:
+            runs.append([code])
+    return runs
+
+
+def escape(text):
+    return ''.join(
+        '\\x00' if c == '\x00' else '\\u{:04X}'.format(ord(c)) for c in text
+    )
+
+
+def generate():
+    joining_types = read_joining_types()
+    names, presentation_forms = read_unicode_data()
+
+    version = re.search(
+        r'-(\d+\.\d+\.\d+)\.txt',
+        io.open(os.path.join(UCD_DIR, 'DerivedJoiningType.txt'), 'r',
+                encoding='utf-8').readline()
+    ).group(1)
+
+    lines = [HEADER, "UNICODE_VERSION = '{}'".format(version), '']
+
+    lines.append('JOINING_TYPES = (')
+    codes = [code for first, last in BLOCKS for code in range(first, last + 1)]
+    for run in segments(codes):
+        lines.append('    (0x{:04X}, ('.format(run[0]))
+        for i in range(0, len(run), 32):
+            chunk = run[i:i + 32]
+            lines.append("        '{}'  # U+{:04X}..U+{:04X}".format(
+                ''.join(joining_types.get(code, 'U') for code in chunk),
+                chunk[0], chunk[-1]
+            ))
+        lines.append('    )),')
+    lines.append(')')
+    lines.append('')
+
+    lines.append('PRESENTATION_FORMS = (')
+    letters = sorted(presentation_forms)
+    for run in segments(range(letters[0], letters[-1] + 1)):
+        lines.append('    (0x{:04X}, ('.format(run[0]))
+        for code in run:
+            forms = presentation_forms.get(code, '\x00' * len(FORMS))
+            # The comments of the longest names are cut to fit in 79 columns
+            lines.append("        '{}'  # {}".format(
+                escape(''.join(forms)), names.get(code, '')
+            ).rstrip(' #')[:79])
+        lines.append('    )),')
+    lines.append(')')
+
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    with io.open(OUTPUT, 'w', encoding='utf-8') as f:
+        f.write(generate())